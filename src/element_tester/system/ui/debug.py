@@ -52,20 +52,41 @@ class DebugDialog(QtWidgets.QDialog):
       when constructing this dialog (see the `if __name__ == "__main__"` block).
     """
 
-    HIGHLIGHT_STYLE = "background-color: #FFD54F; color: #000; font-weight:600;"
-    SUCCESS_STYLE = "background-color: #A5D6A7; color: #000; font-weight:600;"
-    ERROR_STYLE = "background-color: #EF9A9A; color: #000; font-weight:600;"
-    DEFAULT_STYLE = ""  # leave to platform default; can be customized if desired
-
-    def __init__(self, actions: Dict[str, Callable[[], None]], parent: Optional[QtWidgets.QWidget] = None):
+    # One dialog-scoped stylesheet. Widgets are matched by object name and the
+    # action buttons switch appearance through the dynamic "state" property
+    # ("", "selected", "running", "success", "error") instead of swapping
+    # per-widget stylesheets.
+    STYLESHEET = (
+        "QLabel#debugHeader { background-color: #0E7A7A; color: white; }"
+        "QLabel#sectionTitle { background-color: #3A3A3A; color: white; font-size: 11pt;"
+        " font-weight: bold; padding: 8px; border-radius: 4px; }"
+        "QFrame#separator { background-color: #000; height: 2px; margin: 8px 0px; }"
+        "QPushButton#actionBtn { font-size: 12pt; padding: 8px; }"
+        "QPushButton#actionBtn[state='selected'] { background-color: #E0E0E0; font-weight: 600; }"
+        "QPushButton#actionBtn[state='running'] { background-color: #FFD54F; color: #000; font-weight: 600; }"
+        "QPushButton#actionBtn[state='success'] { background-color: #A5D6A7; color: #000; font-weight: 600; }"
+        "QPushButton#actionBtn[state='error'] { background-color: #EF9A9A; color: #000; font-weight: 600; }"
+        "QPushButton#actuateBtn { background-color: #2E7D32; color: white; font-weight: 700; }"
+        "QPushButton#closeBtn { background-color: #C62828; color: white; font-weight: 700; }"
+    )
+
+    def __init__(self, actions: Dict[str, Optional[Callable[[], None]]], parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
         self.setWindowTitle("Debug Console")
         self.resize(720, 520)
+        self.setStyleSheet(self.STYLESHEET)
 
         self._actions = actions
         self._buttons: Dict[str, QtWidgets.QPushButton] = {}
         self._selected_label: Optional[str] = None
 
+        # Single reusable timer for the post-actuation revert; restarting it
+        # coalesces rapid clicks into one pending revert instead of many.
+        self._pending_revert_btn: Optional[QtWidgets.QPushButton] = None
+        self._revert_timer = QtCore.QTimer(self)
+        self._revert_timer.setSingleShot(True)
+        self._revert_timer.timeout.connect(self._do_revert)
+
         self._build_ui()
 
     # -------- UI setup --------
@@ -80,7 +101,7 @@ class DebugDialog(QtWidgets.QDialog):
         header.setFont(header_font)
         header.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         header.setFixedHeight(64)
-        header.setStyleSheet("background-color: #0E7A7A; color: white;")
+        header.setObjectName("debugHeader")
         outer.addWidget(header)
 
         # Buttons area (three-column form-like layout) wrapped in a scroll area
@@ -135,6 +156,10 @@ class DebugDialog(QtWidgets.QDialog):
         # Log output area
         self.log_view = QtWidgets.QPlainTextEdit()
         self.log_view.setReadOnly(True)
+        # Cap history so appends stay constant-cost during long sessions;
+        # the read-only view never needs an undo stack.
+        self.log_view.setMaximumBlockCount(500)
+        self.log_view.setUndoRedoEnabled(False)
         self.log_view.setPlaceholderText("Debug log will appear here...")
         self.log_view.setFixedHeight(120)
         outer.addWidget(self.log_view)
@@ -144,10 +169,10 @@ class DebugDialog(QtWidgets.QDialog):
         btn_row.addStretch(1)
         self.btn_actuate = QtWidgets.QPushButton("ACTUATE")
         self.btn_actuate.setFixedSize(140, 44)
-        self.btn_actuate.setStyleSheet("background-color: #2E7D32; color: white; font-weight:700;")
+        self.btn_actuate.setObjectName("actuateBtn")
         self.btn_close = QtWidgets.QPushButton("CLOSE")
         self.btn_close.setFixedSize(140, 44)
-        self.btn_close.setStyleSheet("background-color: #C62828; color: white; font-weight:700;")
+        self.btn_close.setObjectName("closeBtn")
         btn_row.addWidget(self.btn_actuate)
         btn_row.addWidget(self.btn_close)
 
@@ -166,7 +191,8 @@ class DebugDialog(QtWidgets.QDialog):
         btn = QtWidgets.QPushButton(label)
         btn.setCheckable(True)
         btn.setMinimumHeight(48)
-        btn.setStyleSheet("font-size: 12pt; padding: 8px;")
+        btn.setObjectName("actionBtn")
+        btn.setProperty("state", "")
         btn.clicked.connect(lambda checked, lb=label: self._on_action_button_clicked(lb))
         self._buttons[label] = btn
         return btn
@@ -178,7 +204,7 @@ class DebugDialog(QtWidgets.QDialog):
         line = QtWidgets.QFrame()
         line.setFrameShape(QtWidgets.QFrame.Shape.HLine)
         line.setFrameShadow(QtWidgets.QFrame.Shadow.Sunken)
-        line.setStyleSheet("background-color: #000; height: 2px; margin: 8px 0px;")
+        line.setObjectName("separator")
         return line
     
     def _make_section_title(self, title: str) -> QtWidgets.QLabel:
@@ -187,14 +213,7 @@ class DebugDialog(QtWidgets.QDialog):
         """
         label = QtWidgets.QLabel(title)
         label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        label.setStyleSheet(
-            "background-color: #3A3A3A; "
-            "color: white; "
-            "font-size: 11pt; "
-            "font-weight: bold; "
-            "padding: 8px; "
-            "border-radius: 4px;"
-        )
+        label.setObjectName("sectionTitle")
         label.setFixedHeight(40)
         return label
 
@@ -204,14 +223,23 @@ class DebugDialog(QtWidgets.QDialog):
         for lb, b in self._buttons.items():
             if lb != label:
                 b.setChecked(False)
-                b.setStyleSheet("font-size: 12pt; padding: 8px;")  # reset style
+                self._set_button_state(b, "")  # reset style
         # Mark selected
         self._selected_label = label
         self._buttons[label].setChecked(True)
         # Visually indicate selection (lighter than actuation highlight)
-        self._buttons[label].setStyleSheet("background-color: #E0E0E0; font-weight:600; padding: 8px;")
+        self._set_button_state(self._buttons[label], "selected")
         self._append_log(f"Selected: {label}")
 
+    @staticmethod
+    def _set_button_state(btn: QtWidgets.QPushButton, state: str):
+        """Switch an action button's look via the dialog stylesheet's [state] rules."""
+        if btn.property("state") == state:
+            return
+        btn.setProperty("state", state)
+        # polish() alone re-resolves the stylesheet rules for the new property value
+        btn.style().polish(btn)
+
     def _append_log(self, text: str):
         self.log_view.appendPlainText(text)
 
@@ -231,7 +259,7 @@ class DebugDialog(QtWidgets.QDialog):
         btn = self._buttons.get(label)
         # Highlight selected button immediately
         if btn:
-            btn.setStyleSheet(self.HIGHLIGHT_STYLE)
+            self._set_button_state(btn, "running")
             QtWidgets.QApplication.processEvents()
 
         self._append_log(f"Running: {label}")
@@ -240,23 +268,36 @@ class DebugDialog(QtWidgets.QDialog):
             cb()
             self._append_log(f"✓ Completed: {label}")
             if btn:
-                btn.setStyleSheet(self.SUCCESS_STYLE)
+                self._set_button_state(btn, "success")
         except Exception as e:
             self._append_log(f"✗ Error in '{label}': {e}")
             if btn:
-                btn.setStyleSheet(self.ERROR_STYLE)
+                self._set_button_state(btn, "error")
             QtWidgets.QMessageBox.critical(self, "Debug Error", f"Error while running '{label}':\n{e}")
         finally:
             # Briefly show completion state then revert to normal (non-selected) style.
             if btn:
-                QtCore.QTimer.singleShot(700, lambda b=btn: self._revert_button_style(b))
+                self._schedule_revert(btn)
+
+    def _schedule_revert(self, btn: QtWidgets.QPushButton):
+        self._revert_timer.stop()
+        # A different button still waiting on its revert gets it now.
+        prev = self._pending_revert_btn
+        if prev is not None and prev is not btn:
+            self._revert_button_style(prev)
+        self._pending_revert_btn = btn
+        self._revert_timer.start(700)
+
+    @QtCore.pyqtSlot()
+    def _do_revert(self):
+        btn = self._pending_revert_btn
+        self._pending_revert_btn = None
+        if btn is not None:
+            self._revert_button_style(btn)
 
     def _revert_button_style(self, btn: QtWidgets.QPushButton):
         # If still checked (selected), show selected style; otherwise clear style.
-        if btn.isChecked():
-            btn.setStyleSheet("background-color: #E0E0E0; font-weight:600; padding: 8px;")
-        else:
-            btn.setStyleSheet("font-size: 12pt; padding: 8px;")
+        self._set_button_state(btn, "selected" if btn.isChecked() else "")
 
 # ========== BUTTON SPECIFICATIONS ==========
 # Define all debug buttons in one place for clarity.
@@ -312,42 +353,29 @@ class _MockDRV:
 
         port_used = 12 if bit < 4 else 13
         bit_in_port = bit if bit < 4 else (bit - 4)
-        msg = (
+        self._log(
             f"[SIM] Board {self.board_num} Port {port_used} Bit {bit_in_port} "
             f"-> {'ON' if on else 'OFF'}"
         )
 
-        # Append to the UI log if the dialog exists, otherwise fall back to print().
-        dlg_obj = globals().get("dlg")
-        if dlg_obj is not None:
-            try:
-                dlg_obj._append_log(msg)
-            except Exception:
-                print(msg)
-        else:
-            print(msg)
-
     def all_off(self):
         self._state = [False] * 8
-        msg = f"[SIM] Board {self.board_num} All relays -> OFF"
-        if 'dlg' in globals() and globals().get('dlg') is not None:
-            try:
-                globals()['dlg']._append_log(msg)
-            except Exception:
-                print(msg)
-        else:
-            print(msg)
+        self._log(f"[SIM] Board {self.board_num} All relays -> OFF")
 
     def all_on(self):
         self._state = [True] * 8
-        msg = f"[SIM] Board {self.board_num} All relays -> ON"
-        if 'dlg' in globals() and globals().get('dlg') is not None:
+        self._log(f"[SIM] Board {self.board_num} All relays -> ON")
+
+    def _log(self, msg: str):
+        # Append to the UI log if the dialog exists, otherwise fall back to print().
+        dlg_obj = globals().get("dlg")
+        if dlg_obj is not None:
             try:
-                globals()['dlg']._append_log(msg)
+                dlg_obj._append_log(msg)
+                return
             except Exception:
-                print(msg)
-        else:
-            print(msg)
+                pass
+        print(msg)
 
     def self_test_walk(self, delay_ms: int = 100):
         # simple sync walk for testing purpose
@@ -364,93 +392,18 @@ class _MockDRV:
 local_state = [False] * 8
 
 # Define each callback with clear name and purpose
-def relay_toggle_0():
-    """Toggle MCC Relay 1 (bit 0)"""
-    bit = 0
-    new_state = not local_state[bit]
-    try:
-        drv.set_relay(bit, new_state)
-        local_state[bit] = new_state
-        dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
-    except Exception as e:
-        dlg._append_log(f"Error toggling relay {bit}: {e}")
-
-def relay_toggle_1():
-    """Toggle MCC Relay 2 (bit 1)"""
-    bit = 1
-    new_state = not local_state[bit]
-    try:
-        drv.set_relay(bit, new_state)
-        local_state[bit] = new_state
-        dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
-    except Exception as e:
-        dlg._append_log(f"Error toggling relay {bit}: {e}")
-
-def relay_toggle_2():
-    """Toggle MCC Relay 3 (bit 2)"""
-    bit = 2
-    new_state = not local_state[bit]
-    try:
-        drv.set_relay(bit, new_state)
-        local_state[bit] = new_state
-        dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
-    except Exception as e:
-        dlg._append_log(f"Error toggling relay {bit}: {e}")
-
-def relay_toggle_3():
-    """Toggle MCC Relay 4 (bit 3)"""
-    bit = 3
-    new_state = not local_state[bit]
-    try:
-        drv.set_relay(bit, new_state)
-        local_state[bit] = new_state
-        dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
-    except Exception as e:
-        dlg._append_log(f"Error toggling relay {bit}: {e}")
-
-def relay_toggle_4():
-    """Toggle MCC Relay 5 (bit 4)"""
-    bit = 4
-    new_state = not local_state[bit]
-    try:
-        drv.set_relay(bit, new_state)
-        local_state[bit] = new_state
-        dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
-    except Exception as e:
-        dlg._append_log(f"Error toggling relay {bit}: {e}")
-
-def relay_toggle_5():
-    """Toggle MCC Relay 6 (bit 5)"""
-    bit = 5
-    new_state = not local_state[bit]
-    try:
-        drv.set_relay(bit, new_state)
-        local_state[bit] = new_state
-        dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
-    except Exception as e:
-        dlg._append_log(f"Error toggling relay {bit}: {e}")
-
-def relay_toggle_6():
-    """Toggle MCC Relay 7 (bit 6)"""
-    bit = 6
-    new_state = not local_state[bit]
-    try:
-        drv.set_relay(bit, new_state)
-        local_state[bit] = new_state
-        dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
-    except Exception as e:
-        dlg._append_log(f"Error toggling relay {bit}: {e}")
-
-def relay_toggle_7():
-    """Toggle MCC Relay 8 (bit 7)"""
-    bit = 7
-    new_state = not local_state[bit]
-    try:
-        drv.set_relay(bit, new_state)
-        local_state[bit] = new_state
-        dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
-    except Exception as e:
-        dlg._append_log(f"Error toggling relay {bit}: {e}")
+def make_relay_toggle(bit: int) -> Callable[[], None]:
+    """Build the callback that toggles MCC Relay `bit + 1` (bit 0-7)."""
+    def relay_toggle():
+        new_state = not local_state[bit]
+        try:
+            drv.set_relay(bit, new_state)
+            local_state[bit] = new_state
+            dlg._append_log(f"Relay {bit} → {'ON' if new_state else 'OFF'}")
+        except Exception as e:
+            dlg._append_log(f"Error toggling relay {bit}: {e}")
+    relay_toggle.__name__ = f"relay_toggle_{bit}"
+    return relay_toggle
 
 def all_off_cb():
     try:
@@ -470,7 +423,7 @@ def all_on_cb():
     except Exception as e:
         dlg._append_log(f"Error all_on: {e}")
 
-def self_test_cb():
+def self_test_walk_cb():
     try:
         dlg._append_log("Starting self-test walk...")
         drv.self_test_walk(delay_ms=100)
@@ -683,37 +636,20 @@ if __name__ == "__main__":
 
     # Build actions dict only when running standalone
     actions = {}
+    # Each BUTTON_SPECS callback_name resolves to the module-level "<name>_cb"
+    # function; relay toggles come from the factory. Titles and separators are
+    # layout-only entries and carry no callback.
     callback_map = {
-        "relay_toggle_0": relay_toggle_0,
-        "relay_toggle_1": relay_toggle_1,
-        "relay_toggle_2": relay_toggle_2,
-        "relay_toggle_3": relay_toggle_3,
-        "relay_toggle_4": relay_toggle_4,
-        "relay_toggle_5": relay_toggle_5,
-        "relay_toggle_6": relay_toggle_6,
-        "relay_toggle_7": relay_toggle_7,
-        "all_off": all_off_cb,
-        "all_on": all_on_cb,
-        "self_test_walk": self_test_cb,
-        "hypot_relays": hypot_relays_cb,
-        "hypot_test": hypot_test_cb,
-        "hypot_reset": hypot_reset_cb,
-        # Individual hipot commands
-        "hipot_cmd_test_start": hipot_cmd_test_start_cb,
-        "hipot_cmd_test_stop": hipot_cmd_test_stop_cb,
-        "hipot_cmd_reset": hipot_cmd_reset_cb,
-        "hipot_cmd_get_result": hipot_cmd_get_result_cb,
-        "hipot_cmd_read_result": hipot_cmd_read_result_cb,
-        "hipot_cmd_get_status": hipot_cmd_get_status_cb,
-        # Separators and titles don't need callbacks
-        "separator1": lambda: None,
-        "separator2": lambda: None,
-        "title_relay": lambda: None,
-        "title_hypot": lambda: None,
+        name: globals()[name + "_cb"]
+        for _, name, _ in BUTTON_SPECS
+        if name + "_cb" in globals()
     }
+    callback_map.update({f"relay_toggle_{i}": make_relay_toggle(i) for i in range(8)})
     for label, callback_name, purpose in BUTTON_SPECS:
         if callback_name in callback_map:
             actions[label] = callback_map[callback_name]
+        elif label == "---SEPARATOR---" or label.startswith("[TITLE]"):
+            actions[label] = None
 
     app = QtWidgets.QApplication(sys.argv)
     dlg = DebugDialog(actions)
@@ -1,5 +1,6 @@
 # scanning.py
 from __future__ import annotations
+from pathlib import Path
 from typing import Optional
 
 from PyQt6 import QtWidgets, QtCore, QtGui
@@ -11,9 +12,100 @@ except Exception:
     DebugDialog = None
 
 try:
-    from element_tester.system.ui.settings_dialog import SettingsDialog
+    from element_tester.system.ui.settings_dialog import SettingsDialog, prefetch_settings
 except Exception:
     SettingsDialog = None
+    prefetch_settings = None
+
+
+# One window-level stylesheet, applied once in _build_ui. Widgets pick up their
+# rules through object-name selectors instead of per-widget setStyleSheet calls.
+_SCAN_WINDOW_QSS = """
+    QWidget#ScanWindow {
+        background-color: #D9D9D9;
+    }
+    QLabel#scanHeader {
+        background-color: #5C4B4B;
+        color: #FFFFFF;
+        padding: 10px;
+    }
+    QLineEdit#scanInput {
+        background-color: #FFFFFF;
+        color: #000000;
+        border-radius: 8px;
+        border: 2px solid #CCCCCC;
+        padding: 6px 10px;
+    }
+    QLineEdit#scanInput:focus {
+        border: 2px solid #4A90E2;
+    }
+    QLabel#revisionLabel {
+        background-color: #FFFFFF;
+        color: #000000;
+        padding: 4px 8px;
+        border: 1px solid #CCCCCC;
+        border-radius: 4px;
+    }
+    QPushButton#settingsBtn {
+        background-color: #FFFFFF;
+        border: 1px solid #CCCCCC;
+        border-radius: 5px;
+    }
+    QPushButton#settingsBtn:hover {
+        background-color: #E0E0E0;
+    }
+    QPushButton#startBtn, QPushButton#exitBtn {
+        color: white;
+        border-radius: 10px;
+        padding: 8px 18px;
+    }
+    QPushButton#startBtn {
+        background-color: #4CAF50;
+    }
+    QPushButton#startBtn:hover {
+        background-color: #4CAF50CC;
+    }
+    QPushButton#exitBtn {
+        background-color: #C62828;
+    }
+    QPushButton#exitBtn:hover {
+        background-color: #C62828CC;
+    }
+    QPushButton#startBtn:disabled, QPushButton#exitBtn:disabled {
+        background-color: #999999;
+    }
+"""
+
+
+def _font(point_size: int, bold: bool = False) -> QtGui.QFont:
+    f = QtGui.QFont()
+    f.setPointSize(point_size)
+    f.setBold(bold)
+    return f
+
+
+# Shared fonts; only size/weight are set so family still follows the app font
+_HEADER_FONT = _font(24, bold=True)
+_INPUT_FONT = _font(16)
+_BTN_FONT = _font(16, bold=True)
+_REVISION_FONT = _font(10)
+
+_COG_ICON: Optional[QtGui.QIcon] = None
+_COG_ICON_LOADED = False
+
+
+def _get_cog_icon() -> Optional[QtGui.QIcon]:
+    """Settings cog icon, loaded from the widgets folder on first use (None if missing)."""
+    global _COG_ICON, _COG_ICON_LOADED
+    if not _COG_ICON_LOADED:
+        _COG_ICON_LOADED = True
+        try:
+            icon_path = Path(__file__).parent.parent / "widgets" / "settings_cog.svg"
+            if icon_path.exists():
+                _COG_ICON = QtGui.QIcon(str(icon_path))
+        except Exception:
+            _COG_ICON = None
+    return _COG_ICON
 
 
 class ScanWindow(QtWidgets.QWidget):
@@ -32,15 +124,25 @@ class ScanWindow(QtWidgets.QWidget):
         super().__init__(parent)
         self.setWindowTitle("Scan Work Order / Part Number")
         self.resize(900, 520)
+        # Secondary dialogs are built on first use and reused afterwards.
+        self._settings_dlg = None
+        self._debug_dlg = None
+        self._missing_mb: Optional[QMessageBox] = None
+        # Whether each scan field holds non-blank text (drives START enabling)
+        self._wo_nonempty = False
+        self._pn_nonempty = False
         self._build_ui()
         self._wire_signals()
+        # Read saved settings in the background so the cog opens without disk I/O
+        self._settings_future = prefetch_settings() if prefetch_settings is not None else None
 
     # ---------------- UI ----------------
     def _build_ui(self):
-        self.setAutoFillBackground(True)
-        pal = self.palette()
-        pal.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor("#D9D9D9"))
-        self.setPalette(pal)
+        # Background comes from the #ScanWindow rule; a plain QWidget subclass
+        # only paints stylesheet backgrounds with WA_StyledBackground set.
+        self.setObjectName("ScanWindow")
+        self.setAttribute(QtCore.Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setStyleSheet(_SCAN_WINDOW_QSS)
 
         root = QtWidgets.QVBoxLayout(self)
         root.setContentsMargins(40, 30, 40, 30)
@@ -79,8 +181,8 @@ class ScanWindow(QtWidgets.QWidget):
         self.btn_start = QtWidgets.QPushButton("START")
         self.btn_exit = QtWidgets.QPushButton("EXIT")
 
-        self._style_main_button(self.btn_start, bg="#4CAF50")
-        self._style_main_button(self.btn_exit, bg="#C62828")
+        self._style_main_button(self.btn_start, "startBtn")
+        self._style_main_button(self.btn_exit, "exitBtn")
 
         self.btn_start.setEnabled(False)   # enabled once both fields filled
 
@@ -94,20 +196,8 @@ class ScanWindow(QtWidgets.QWidget):
         # ---- Revision Date (bottom left) ----
         revision_row = QtWidgets.QHBoxLayout()
         self.revision_label = QtWidgets.QLabel("Last Revision: March 3, 2026 | 5.06PM")
-        self.revision_label.setStyleSheet(
-            """
-            QLabel {
-                background-color: #FFFFFF;
-                color: #000000;
-                padding: 4px 8px;
-                border: 1px solid #CCCCCC;
-                border-radius: 4px;
-            }
-            """
-        )
-        f = self.revision_label.font()
-        f.setPointSize(10)
-        self.revision_label.setFont(f)
+        self.revision_label.setObjectName("revisionLabel")
+        self.revision_label.setFont(_REVISION_FONT)
         revision_row.addWidget(self.revision_label)
         revision_row.addStretch(1)
         
@@ -116,26 +206,15 @@ class ScanWindow(QtWidgets.QWidget):
         self.btn_settings.setFixedSize(40, 40)
         self.btn_settings.setToolTip("Settings")
         
-        # Load settings icon from widgets folder
-        try:
-            from pathlib import Path
-            icon_path = Path(__file__).parent.parent / "widgets" / "settings_cog.svg"
-            if icon_path.exists():
-                self.btn_settings.setIcon(QtGui.QIcon(str(icon_path)))
-                self.btn_settings.setIconSize(QtCore.QSize(24, 24))
-        except Exception:
+        # Settings icon is loaded once per process and shared
+        cog = _get_cog_icon()
+        if cog is not None:
+            self.btn_settings.setIcon(cog)
+            self.btn_settings.setIconSize(QtCore.QSize(24, 24))
+        else:
             self.btn_settings.setText("⚙")
         
-        self.btn_settings.setStyleSheet("""
-            QPushButton {
-                background-color: #FFFFFF;
-                border: 1px solid #CCCCCC;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #E0E0E0;
-            }
-        """)
+        self.btn_settings.setObjectName("settingsBtn")
         revision_row.addWidget(self.btn_settings)
         root.addLayout(revision_row)
 
@@ -144,78 +223,36 @@ class ScanWindow(QtWidgets.QWidget):
     # ---------------- Helpers ----------------
     def _make_header_label(self, text: str) -> QtWidgets.QLabel:
         lab = QtWidgets.QLabel(text)
-        f = lab.font()
-        f.setPointSize(24)
-        f.setBold(True)
-        lab.setFont(f)
+        lab.setFont(_HEADER_FONT)
         lab.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         lab.setMinimumHeight(60)
-        lab.setStyleSheet(
-            """
-            QLabel {
-                background-color: #5C4B4B;
-                color: #FFFFFF;
-                padding: 10px;
-            }
-            """
-        )
+        lab.setObjectName("scanHeader")
         return lab
 
     def _make_input_line(self) -> QtWidgets.QLineEdit:
         edit = QtWidgets.QLineEdit()
         edit.setPlaceholderText("Value")
-        f = edit.font()
-        f.setPointSize(16)
-        edit.setFont(f)
+        edit.setFont(_INPUT_FONT)
         edit.setMinimumHeight(40)
-        edit.setStyleSheet(
-            """
-            QLineEdit {
-                background-color: #FFFFFF;
-                color: #000000;
-                border-radius: 8px;
-                border: 2px solid #CCCCCC;
-                padding: 6px 10px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4A90E2;
-            }
-            """
-        )
+        edit.setObjectName("scanInput")
         return edit
 
-    def _style_main_button(self, btn: QtWidgets.QPushButton, bg: str):
+    def _style_main_button(self, btn: QtWidgets.QPushButton, name: str):
         btn.setMinimumWidth(160)
         btn.setMinimumHeight(45)
-        f = btn.font()
-        f.setPointSize(16)
-        f.setBold(True)
-        btn.setFont(f)
-        btn.setStyleSheet(
-            f"""
-            QPushButton {{
-                background-color: {bg};
-                color: white;
-                border-radius: 10px;
-                padding: 8px 18px;
-            }}
-            QPushButton:hover {{
-                background-color: {bg}CC;
-            }}
-            QPushButton:disabled {{
-                background-color: #999999;
-            }}
-            """
-        )
+        btn.setFont(_BTN_FONT)
+        btn.setObjectName(name)
 
     # ---------------- Logic ----------------
     def _wire_signals(self):
         self.work_edit.returnPressed.connect(self._focus_part)
         self.part_edit.returnPressed.connect(self._emit_scan_completed)
 
-        # Enable START when both fields have values
-        self.work_edit.textChanged.connect(self._check_ready)
-        self.part_edit.textChanged.connect(self._check_ready)
+        # Enable START when both fields have values. Each keystroke only
+        # updates a cached bool; START is touched when a field flips between
+        # blank and non-blank.
+        self.work_edit.textChanged.connect(self._on_wo_text)
+        self.part_edit.textChanged.connect(self._on_pn_text)
 
         # Button actions
         self.btn_start.clicked.connect(self._emit_scan_completed)
@@ -227,13 +264,23 @@ class ScanWindow(QtWidgets.QWidget):
             btn_dbg.clicked.connect(self._on_debug_clicked)
 
     def _focus_part(self):
-        self.part_edit.setFocus()
-        self.part_edit.selectAll()
+        # Tab focus reason makes QLineEdit select any existing text itself
+        self.part_edit.setFocus(QtCore.Qt.FocusReason.TabFocusReason)
+
+    def _on_wo_text(self, text: str):
+        nonempty = bool(text.strip())
+        if nonempty != self._wo_nonempty:
+            self._wo_nonempty = nonempty
+            self._check_ready()
+
+    def _on_pn_text(self, text: str):
+        nonempty = bool(text.strip())
+        if nonempty != self._pn_nonempty:
+            self._pn_nonempty = nonempty
+            self._check_ready()
 
     def _check_ready(self):
-        wo = self.work_edit.text().strip()
-        pn = self.part_edit.text().strip()
-        self.btn_start.setEnabled(bool(wo and pn))
+        self.btn_start.setEnabled(self._wo_nonempty and self._pn_nonempty)
 
     def clear_fields(self):
         """Clear both input fields and reset START button state."""
@@ -251,8 +298,13 @@ class ScanWindow(QtWidgets.QWidget):
         wo = self.work_edit.text().strip()
         pn = self.part_edit.text().strip()
         if not wo or not pn:
-            QtWidgets.QMessageBox.warning(self, "Missing Data",
-                "Please scan both the Work Order and Part Number.")
+            # Mis-scans can repeat, so the warning box is built once and reused
+            if self._missing_mb is None:
+                self._missing_mb = QMessageBox(
+                    QMessageBox.Icon.Warning, "Missing Data",
+                    "Please scan both the Work Order and Part Number.",
+                    QMessageBox.StandardButton.Ok, self)
+            self._missing_mb.exec()
             return
 
         # Emit to whoever is listening
@@ -266,9 +318,10 @@ class ScanWindow(QtWidgets.QWidget):
             QMessageBox.warning(self, "Debug Not Available", "DebugDialog import failed or is unavailable.")
             return
 
-        actions = { "Placeholder": lambda: None }
-        dlg = DebugDialog(actions)
-        dlg.exec()  # <-- This shows the dialog modally
+        if self._debug_dlg is None:
+            actions = { "Placeholder": lambda: None }
+            self._debug_dlg = DebugDialog(actions)
+        self._debug_dlg.exec()  # <-- This shows the dialog modally
 
     def _on_settings_clicked(self):
         """Open settings dialog."""
@@ -276,8 +329,10 @@ class ScanWindow(QtWidgets.QWidget):
             QMessageBox.warning(self, "Settings Not Available", "SettingsDialog import failed or is unavailable.")
             return
         
-        dlg = SettingsDialog(self)
-        dlg.exec()
+        if self._settings_dlg is None:
+            self._settings_dlg = SettingsDialog(self, settings_future=self._settings_future)
+        # The dialog refreshes its controls from the saved values when shown
+        self._settings_dlg.exec()
 
 
 # Standalone tester
@@ -7,6 +7,8 @@ Allows user to select relay driver (MCC_ERB or MCC_PDIS) and meter driver (FLUKE
 """
 
 from __future__ import annotations
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import replace
 from typing import Optional
 from pathlib import Path
 
@@ -20,40 +22,179 @@ except ImportError:
     AppSettings = None
 
 
+# One dialog-level stylesheet, applied once before the widgets are built.
+# Widgets pick up their rules through object-name selectors.
+_SETTINGS_DIALOG_QSS = """
+    QDialog#SettingsDialog {
+        background-color: #353535;
+        color: #FFFFFF;
+    }
+    QLabel#SettingsTitle {
+        background-color: #2a82da;
+        color: #FFFFFF;
+        padding: 10px;
+        border-radius: 5px;
+    }
+    QGroupBox#SettingsGroup {
+        font-size: 12pt;
+        font-weight: bold;
+        color: #FFFFFF;
+        border: 2px solid #555555;
+        border-radius: 5px;
+        margin-top: 10px;
+        padding-top: 10px;
+    }
+    QGroupBox#SettingsGroup::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #FFFFFF;
+    }
+    QLabel#SettingsLabel {
+        color: #FFFFFF;
+    }
+    QLabel#SettingsDesc {
+        padding: 10px;
+        background-color: #404040;
+        color: #FFFFFF;
+        border-radius: 3px;
+        border: 1px solid #555555;
+    }
+    QComboBox#SettingsCombo {
+        background-color: #353535;
+        color: #FFFFFF;
+        border: 2px solid #555555;
+        border-radius: 5px;
+        padding: 5px;
+    }
+    QComboBox#SettingsCombo:focus {
+        border: 2px solid #2a82da;
+    }
+    QComboBox#SettingsCombo::drop-down {
+        border: none;
+    }
+    QComboBox#SettingsCombo QAbstractItemView {
+        background-color: #353535;
+        color: #FFFFFF;
+        selection-background-color: #2a82da;
+        selection-color: #FFFFFF;
+    }
+    QLineEdit#SettingsLineEdit {
+        background-color: #353535;
+        color: #FFFFFF;
+        border: 2px solid #555555;
+        border-radius: 5px;
+        padding: 5px;
+    }
+    QLineEdit#SettingsLineEdit:focus {
+        border: 2px solid #2a82da;
+    }
+    QPushButton#SaveBtn, QPushButton#CancelBtn {
+        color: white;
+        border-radius: 5px;
+        padding: 5px 15px;
+    }
+    QPushButton#SaveBtn {
+        background-color: #4CAF50;
+    }
+    QPushButton#SaveBtn:hover {
+        background-color: #45a049;
+    }
+    QPushButton#CancelBtn {
+        background-color: #757575;
+    }
+    QPushButton#CancelBtn:hover {
+        background-color: #616161;
+    }
+"""
+
+
+def _font(point_size: int, bold: bool = False) -> QtGui.QFont:
+    f = QtGui.QFont()
+    f.setPointSize(point_size)
+    f.setBold(bold)
+    return f
+
+
+# Shared fonts; only size/weight are set so family still follows the app font
+_TITLE_FONT = _font(16, bold=True)
+_LABEL_FONT = _font(11)
+_COMBO_FONT = _font(11)
+_BTN_FONT = _font(11, bold=True)
+
+
+# Settings manager state is process-wide; every dialog shares this instance.
+_SETTINGS_MANAGER = SettingsManager() if SettingsManager else None
+
+
+def prefetch_settings() -> Optional[Future]:
+    """
+    Start loading the saved settings on a worker thread.
+
+    Reads instrument_configuration.json ahead of the first dialog open, keeping
+    the disk read off the GUI thread. The one-shot executor is created here and
+    shut down right after the submit, so its thread exits once the read is done.
+
+    Returns:
+        Future resolving to AppSettings, or None if SettingsManager is unavailable
+    """
+    if _SETTINGS_MANAGER is None:
+        return None
+    loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="settings-load")
+    try:
+        return loader.submit(_SETTINGS_MANAGER.load)
+    finally:
+        # Non-blocking: the submitted read still runs to completion
+        loader.shutdown(wait=False)
+
+
 class SettingsDialog(QDialog):
     """
     Dialog for configuring application settings.
     
     Settings saved to: system/core/instrument_configuration.json
     """
+
+    RELAY_DRIVERS = ("MCC_ERB", "MCC_PDIS")
+    METER_DRIVERS = ("FLUKE287", "UT61E")
     
-    def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
+    def __init__(self, parent: Optional[QtWidgets.QWidget] = None,
+                 settings_future: Optional[Future] = None):
         super().__init__(parent)
         self.setWindowTitle("Settings")
         self.setModal(True)
         self.resize(500, 400)
+        # Persisted (relay_driver, meter_driver, fluke_port) last pushed into the controls
+        self._last_loaded_sig: Optional[tuple] = None
         
         if SettingsManager is None:
             QMessageBox.critical(self, "Import Error", "Failed to import SettingsManager")
             self.reject()
             return
         
-        self.settings_manager = SettingsManager()
-        self.current_settings = self.settings_manager.load()
+        self.settings_manager = _SETTINGS_MANAGER
+        if settings_future is not None:
+            # Already resolved when prefetched early enough; otherwise waits
+            self.current_settings = settings_future.result()
+        else:
+            self.current_settings = self.settings_manager.load()
         
         self._build_ui()
-        self._load_current_settings()
+        # Controls are populated in showEvent, once Qt is about to paint
+
+    def showEvent(self, event):
+        """Push the current settings into the controls each time the dialog opens."""
+        super().showEvent(event)
+        if SettingsManager is not None:
+            self._load_current_settings()
     
     def _build_ui(self):
         """Build the settings dialog UI."""
-        # Set dark theme background
-        self.setAutoFillBackground(True)
-        pal = self.palette()
-        pal.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor(53, 53, 53))
-        pal.setColor(QtGui.QPalette.ColorRole.WindowText, QtGui.QColor(255, 255, 255))
-        pal.setColor(QtGui.QPalette.ColorRole.Base, QtGui.QColor(35, 35, 35))
-        pal.setColor(QtGui.QPalette.ColorRole.Text, QtGui.QColor(255, 255, 255))
-        self.setPalette(pal)
+        # Suppress intermediate repaints while the widget tree is assembled
+        self.setUpdatesEnabled(False)
+        # Dark theme background comes from the #SettingsDialog rule
+        self.setObjectName("SettingsDialog")
+        self.setStyleSheet(_SETTINGS_DIALOG_QSS)
         
         main_layout = QVBoxLayout(self)
         main_layout.setContentsMargins(20, 20, 20, 20)
@@ -61,79 +202,29 @@ class SettingsDialog(QDialog):
         
         # Title
         title = QLabel("Application Settings")
-        title_font = title.font()
-        title_font.setPointSize(16)
-        title_font.setBold(True)
-        title.setFont(title_font)
+        title.setFont(_TITLE_FONT)
         title.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        title.setStyleSheet("""
-            QLabel {
-                background-color: #2a82da;
-                color: #FFFFFF;
-                padding: 10px;
-                border-radius: 5px;
-            }
-        """)
+        title.setObjectName("SettingsTitle")
         main_layout.addWidget(title)
         
         # Relay Driver Selection
         relay_group = QtWidgets.QGroupBox("Relay Driver Configuration")
-        relay_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 12pt;
-                font-weight: bold;
-                color: #FFFFFF;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #FFFFFF;
-            }
-        """)
+        relay_group.setObjectName("SettingsGroup")
         relay_layout = QVBoxLayout()
         
         # Dropdown label and combo
         dropdown_layout = QHBoxLayout()
         
         relay_label = QLabel("Select Relay Driver:")
-        relay_label_font = relay_label.font()
-        relay_label_font.setPointSize(11)
-        relay_label.setFont(relay_label_font)
-        relay_label.setStyleSheet("QLabel { color: #FFFFFF; }")
+        relay_label.setFont(_LABEL_FONT)
+        relay_label.setObjectName("SettingsLabel")
         dropdown_layout.addWidget(relay_label)
         
         self.relay_combo = QComboBox()
-        self.relay_combo.addItems(["MCC_ERB", "MCC_PDIS"])
+        self.relay_combo.insertItems(0, self.RELAY_DRIVERS)
         self.relay_combo.setMinimumHeight(35)
-        combo_font = self.relay_combo.font()
-        combo_font.setPointSize(11)
-        self.relay_combo.setFont(combo_font)
-        self.relay_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #353535;
-                color: #FFFFFF;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QComboBox:focus {
-                border: 2px solid #2a82da;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #353535;
-                color: #FFFFFF;
-                selection-background-color: #2a82da;
-                selection-color: #FFFFFF;
-            }
-        """)
+        self.relay_combo.setFont(_COMBO_FONT)
+        self.relay_combo.setObjectName("SettingsCombo")
         dropdown_layout.addWidget(self.relay_combo, 1)
         
         relay_layout.addLayout(dropdown_layout)
@@ -143,7 +234,7 @@ class SettingsDialog(QDialog):
             "<b>MCC_ERB:</b> MCC USB-ERB08 (Board 0, Ports 12-13)<br>"
             "<b>MCC_PDIS:</b> MCC USB-PDIS08 (Board 1, Port 1)"
         )
-        desc_label.setStyleSheet("QLabel { padding: 10px; background-color: #404040; color: #FFFFFF; border-radius: 3px; border: 1px solid #555555; }")
+        desc_label.setObjectName("SettingsDesc")
         relay_layout.addWidget(desc_label)
         
         relay_group.setLayout(relay_layout)
@@ -151,62 +242,22 @@ class SettingsDialog(QDialog):
         
         # Meter Driver Selection
         meter_group = QtWidgets.QGroupBox("Meter Driver Configuration")
-        meter_group.setStyleSheet("""
-            QGroupBox {
-                font-size: 12pt;
-                font-weight: bold;
-                color: #FFFFFF;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                margin-top: 10px;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #FFFFFF;
-            }
-        """)
+        meter_group.setObjectName("SettingsGroup")
         meter_layout = QVBoxLayout()
         
         # Dropdown label and combo
         meter_dropdown_layout = QHBoxLayout()
         
         meter_label = QLabel("Select Meter Driver:")
-        meter_label_font = meter_label.font()
-        meter_label_font.setPointSize(11)
-        meter_label.setFont(meter_label_font)
-        meter_label.setStyleSheet("QLabel { color: #FFFFFF; }")
+        meter_label.setFont(_LABEL_FONT)
+        meter_label.setObjectName("SettingsLabel")
         meter_dropdown_layout.addWidget(meter_label)
         
         self.meter_combo = QComboBox()
-        self.meter_combo.addItems(["FLUKE287", "UT61E"])
+        self.meter_combo.insertItems(0, self.METER_DRIVERS)
         self.meter_combo.setMinimumHeight(35)
-        meter_combo_font = self.meter_combo.font()
-        meter_combo_font.setPointSize(11)
-        self.meter_combo.setFont(meter_combo_font)
-        self.meter_combo.setStyleSheet("""
-            QComboBox {
-                background-color: #353535;
-                color: #FFFFFF;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QComboBox:focus {
-                border: 2px solid #2a82da;
-            }
-            QComboBox::drop-down {
-                border: none;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #353535;
-                color: #FFFFFF;
-                selection-background-color: #2a82da;
-                selection-color: #FFFFFF;
-            }
-        """)
+        self.meter_combo.setFont(_COMBO_FONT)
+        self.meter_combo.setObjectName("SettingsCombo")
         meter_dropdown_layout.addWidget(self.meter_combo, 1)
         
         meter_layout.addLayout(meter_dropdown_layout)
@@ -216,7 +267,7 @@ class SettingsDialog(QDialog):
             "<b>FLUKE287:</b> Fluke 287 Datalogging Multimeter (Serial)<br>"
             "<b>UT61E:</b> UNI-T UT61E Multimeter (USB HID via UT61xP)"
         )
-        meter_desc_label.setStyleSheet("QLabel { padding: 10px; background-color: #404040; color: #FFFFFF; border-radius: 3px; border: 1px solid #555555; }")
+        meter_desc_label.setObjectName("SettingsDesc")
         meter_layout.addWidget(meter_desc_label)
 
         meter_ports = QGridLayout()
@@ -225,22 +276,11 @@ class SettingsDialog(QDialog):
         meter_ports.setVerticalSpacing(8)
 
         fluke_label = QLabel("FLUKE287 COM Port:")
-        fluke_label.setStyleSheet("QLabel { color: #FFFFFF; }")
+        fluke_label.setObjectName("SettingsLabel")
         self.fluke_com_edit = QLineEdit()
         self.fluke_com_edit.setPlaceholderText("COM11")
         self.fluke_com_edit.setMinimumHeight(30)
-        self.fluke_com_edit.setStyleSheet("""
-            QLineEdit {
-                background-color: #353535;
-                color: #FFFFFF;
-                border: 2px solid #555555;
-                border-radius: 5px;
-                padding: 5px;
-            }
-            QLineEdit:focus {
-                border: 2px solid #2a82da;
-            }
-        """)
+        self.fluke_com_edit.setObjectName("SettingsLineEdit")
 
         meter_ports.addWidget(fluke_label, 0, 0)
         meter_ports.addWidget(self.fluke_com_edit, 0, 1)
@@ -262,40 +302,18 @@ class SettingsDialog(QDialog):
         for btn in [self.save_button, self.cancel_button]:
             btn.setMinimumWidth(100)
             btn.setMinimumHeight(35)
-            btn_font = btn.font()
-            btn_font.setPointSize(11)
-            btn_font.setBold(True)
-            btn.setFont(btn_font)
+            btn.setFont(_BTN_FONT)
         
-        self.save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                border-radius: 5px;
-                padding: 5px 15px;
-            }
-            QPushButton:hover {
-                background-color: #45a049;
-            }
-        """)
+        self.save_button.setObjectName("SaveBtn")
         
-        self.cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #757575;
-                color: white;
-                border-radius: 5px;
-                padding: 5px 15px;
-            }
-            QPushButton:hover {
-                background-color: #616161;
-            }
-        """)
+        self.cancel_button.setObjectName("CancelBtn")
         
         button_layout.addWidget(self.save_button)
         button_layout.addSpacing(10)
         button_layout.addWidget(self.cancel_button)
         button_layout.addStretch()
         
+        self.setUpdatesEnabled(True)
         main_layout.addLayout(button_layout)
         
         # Connect signals
@@ -304,30 +322,43 @@ class SettingsDialog(QDialog):
     
     def _load_current_settings(self):
         """Load current settings into UI controls."""
-        # Set relay driver combo
-        index = self.relay_combo.findText(self.current_settings.relay_driver)
-        if index >= 0:
-            self.relay_combo.setCurrentIndex(index)
-        
-        # Set meter driver combo
-        meter_index = self.meter_combo.findText(self.current_settings.meter_driver)
-        if meter_index >= 0:
-            self.meter_combo.setCurrentIndex(meter_index)
+        # current_settings only changes after a successful save, so this
+        # signature always describes what is on disk
+        s = self.current_settings
+        sig = (s.relay_driver, s.meter_driver, s.fluke_port)
+        if sig == self._last_loaded_sig:
+            return  # controls already show these values
+        # Populating the controls should not fire their change signals
+        with QtCore.QSignalBlocker(self.relay_combo):
+            # Non-editable combos only change selection when the text matches an item
+            self.relay_combo.setCurrentText(s.relay_driver)
+        with QtCore.QSignalBlocker(self.meter_combo):
+            self.meter_combo.setCurrentText(s.meter_driver)
+        with QtCore.QSignalBlocker(self.fluke_com_edit):
+            self.fluke_com_edit.setText(s.fluke_port)
+        self._last_loaded_sig = sig
 
-        self.fluke_com_edit.setText(self.current_settings.fluke_port)
+    def reject(self):
+        """Cancel: forget the loaded signature so edits are discarded on the next load."""
+        self._last_loaded_sig = None
+        super().reject()
     
     def _on_save(self):
         """Save settings and close dialog."""
-        # Update settings from UI
-        self.current_settings.relay_driver = self.relay_combo.currentText()
-        self.current_settings.meter_driver = self.meter_combo.currentText()
-
-        self.current_settings.fluke_port = self.fluke_com_edit.text().strip().upper() or "COM11"
+        # Build the new settings in a copy; the cached dialog keeps the
+        # persisted values in current_settings until the save succeeds
+        new_settings = replace(
+            self.current_settings,
+            relay_driver=self.relay_combo.currentText(),
+            meter_driver=self.meter_combo.currentText(),
+            fluke_port=self.fluke_com_edit.text().strip().upper() or "COM11",
+        )
         
         # Save to file
-        success = self.settings_manager.save(self.current_settings)
+        success = self.settings_manager.save(new_settings)
         
         if success:
+            self.current_settings = new_settings
             QMessageBox.information(
                 self,
                 "Settings Applied",
@@ -338,6 +369,8 @@ class SettingsDialog(QDialog):
             )
             self.accept()
         else:
+            # Controls now hold unsaved edits; force a reload on the next open
+            self._last_loaded_sig = None
             QMessageBox.critical(
                 self,
                 "Save Failed",
@@ -10,7 +10,7 @@ This coordinator:
 - Provides show/hide methods for each window
 - Handles state transitions between screens
 - Updates test progress (hipot, measurements)
-- Centralizes QApplication.processEvents() calls
+- Leaves repainting to the Qt event loop (events are only flushed on show)
 
 Usage:
     coordinator = TestCoordinator()
@@ -21,9 +21,71 @@ Usage:
     coordinator.update_hipot_step(1, "Reset instrument", simulate=True)
 """
 
-from typing import Optional, Callable
-import time
-from PyQt6 import QtWidgets
+from typing import Callable, Dict, Optional, Tuple
+import collections
+import functools
+import logging
+from PyQt6 import QtCore, QtWidgets
+
+_log = logging.getLogger(__name__)
+
+# Visual pacing between queued hipot step messages
+_HIPOT_STEP_INTERVAL_MS = 800
+
+# Measurement row labels, indexed by position
+_CONFIG_NAMES = ("Pin 1 to 6", "Pin 2 to 5", "Pin 3 to 4")
+_BLANK_TEXT = tuple(f"{name}: ---" for name in _CONFIG_NAMES)
+
+# Preformatted measurement texts per row label
+_VALUE_FMT = {name: f"{name}: %.1f Ω" for name in _CONFIG_NAMES}
+_TIMEOUT_TEXT = {name: f"{name}: TIMEOUT" for name in _CONFIG_NAMES}
+
+
+# Window classes are imported on first use and cached, so the UI modules are
+# only loaded when needed and later calls skip the import machinery.
+@functools.lru_cache(maxsize=None)
+def _scan_cls():
+    from element_tester.system.ui.scanning import ScanWindow
+    return ScanWindow
+
+
+@functools.lru_cache(maxsize=None)
+def _config_cls():
+    from element_tester.system.ui.configuration_ui import ConfigurationWindow
+    return ConfigurationWindow
+
+
+@functools.lru_cache(maxsize=None)
+def _test_cls():
+    from element_tester.system.ui.testing import MainTestWindow
+    return MainTestWindow
+
+
+@functools.lru_cache(maxsize=None)
+def _continue_exit_cls():
+    from element_tester.system.widgets.continue_exit import ContinueExitDialog
+    return ContinueExitDialog
+
+
+@functools.lru_cache(maxsize=None)
+def _test_passed_cls():
+    from element_tester.system.widgets.test_passed import TestPassedDialog
+    return TestPassedDialog
+
+
+class _GuiInvoker(QtCore.QObject):
+    """Runs callables posted from worker threads on the thread it lives in (the GUI thread)."""
+    
+    call = QtCore.pyqtSignal(object)
+    
+    def __init__(self):
+        super().__init__()
+        # Emitted off-thread, delivered queued because the receiver lives on the GUI thread
+        self.call.connect(self._run)
+    
+    @QtCore.pyqtSlot(object)
+    def _run(self, fn: Callable[[], None]) -> None:
+        fn()
 
 
 class TestCoordinator:
@@ -34,6 +96,16 @@ class TestCoordinator:
     directly manipulating window objects.
     """
     
+    # Fixed attribute set; nothing assigns extra attributes on the coordinator
+    __slots__ = (
+        "scan_window", "config_window", "test_window",
+        "on_scan_complete_callback", "on_config_complete_callback", "on_test_complete_callback",
+        "_tw_has_clear_hipot", "_tw_has_clear_meas", "_append_meas",
+        "_hipot_queue", "_hipot_timer",
+        "_pending_meas", "_flush_posted",
+        "_invoker",
+    )
+    
     def __init__(self):
         """Initialize coordinator with no windows."""
         self.scan_window = None
@@ -44,34 +116,70 @@ class TestCoordinator:
         self.on_scan_complete_callback: Optional[Callable] = None
         self.on_config_complete_callback: Optional[Callable] = None
         self.on_test_complete_callback: Optional[Callable] = None
+        
+        # Optional test-window capabilities, probed once when the window is created
+        self._tw_has_clear_hipot = False
+        self._tw_has_clear_meas = False
+        self._append_meas: Optional[Callable[[str], None]] = None
+        
+        # Hipot step messages are paced by a timer instead of sleeping on the UI thread
+        self._hipot_queue = collections.deque()
+        self._hipot_timer = QtCore.QTimer()
+        self._hipot_timer.setInterval(_HIPOT_STEP_INTERVAL_MS)
+        self._hipot_timer.setSingleShot(False)
+        self._hipot_timer.timeout.connect(self._drain_hipot_step)
+        
+        # Latest measurement text/state per (side, position) sent from worker
+        # threads, drained by one posted _flush_updates call
+        self._pending_meas: Dict[Tuple[str, int], Tuple[str, Optional[bool]]] = {}
+        self._flush_posted = False
+        
+        # Every cross-thread updater call hops to the GUI thread through this
+        self._invoker = _GuiInvoker()
     
     # ============================================================================
     # Window Management - Show/Hide
     # ============================================================================
     
+    def _ensure(self, attr: str, factory: Callable[[], QtWidgets.QWidget]) -> QtWidgets.QWidget:
+        """Return the window stored in `attr`, creating it with `factory` on first use."""
+        w = getattr(self, attr)
+        if w is None:
+            w = factory()
+            setattr(self, attr, w)
+        return w
+    
+    def _present(self, w: QtWidgets.QWidget) -> None:
+        """Show, raise and focus a window, flushing only its own show/paint events."""
+        w.show()
+        w.raise_()
+        w.activateWindow()
+        self._flush_show(w)
+    
+    def _hide(self, attr: str) -> None:
+        """Hide the window stored in `attr` (if any), keeping it for reuse."""
+        w = getattr(self, attr)
+        if w:
+            w.hide()
+    
+    def _destroy(self, attr: str) -> None:
+        """Close the window stored in `attr` and drop the reference."""
+        w = getattr(self, attr)
+        if w:
+            w.close()
+            setattr(self, attr, None)
+    
     def show_scan_window(self) -> None:
         """Show the scanning window (Work Order + Part Number entry)."""
-        if self.scan_window is None:
-            from element_tester.system.ui.scanning import ScanWindow
-            self.scan_window = ScanWindow()
-        
-        self.scan_window.show()
-        self.scan_window.raise_()
-        self.scan_window.activateWindow()
-        self._process_events()
+        self._present(self._ensure("scan_window", _scan_cls()))
     
     def hide_scan_window(self) -> None:
         """Hide the scanning window."""
-        if self.scan_window:
-            self.scan_window.hide()
-            self._process_events()
+        self._hide("scan_window")
     
-    def close_scan_window(self) -> None:
-        """Close and destroy the scanning window."""
-        if self.scan_window:
-            self.scan_window.close()
-            self.scan_window = None
-            self._process_events()
+    def _destroy_scan_window(self) -> None:
+        """Close and destroy the scanning window (only from cleanup; otherwise hide and reuse)."""
+        self._destroy("scan_window")
     
     def show_config_window(self, work_order: str = "", part_number: str = "") -> Optional[dict]:
         """
@@ -85,8 +193,7 @@ class TestCoordinator:
             Dict with voltage, wattage, resistance_range or None if cancelled
         """
         try:
-            from element_tester.system.ui.configuration_ui import ConfigurationWindow
-            cfg = ConfigurationWindow.get_configuration(None, work_order, part_number)
+            cfg = _config_cls().get_configuration(None, work_order, part_number)
             
             if cfg is None:
                 return None
@@ -102,38 +209,36 @@ class TestCoordinator:
                 selected["resistance_range"] = (0.0, 0.0)
             
             return selected
-        except Exception as e:
-            print(f"Error showing config window: {e}")
+        except Exception:
+            _log.exception("Error showing config window")
             return None
     
     def hide_config_window(self) -> None:
-        """Hide the configuration window (if shown)."""
-        # ConfigurationWindow is modal dialog, closes automatically
-        self._process_events()
+        """
+        Hide the configuration window (if shown).
+        
+        No-op: ConfigurationWindow is a modal dialog that closes itself, so
+        there is nothing to hide. Kept for API compatibility.
+        """
     
     def show_test_window(self) -> None:
         """Show the main test window (hipot + measurements)."""
-        if self.test_window is None:
-            from element_tester.system.ui.testing import MainTestWindow
-            self.test_window = MainTestWindow()
-        
-        self.test_window.show()
-        self.test_window.raise_()
-        self.test_window.activateWindow()
-        self._process_events()
+        created = self.test_window is None
+        tw = self._ensure("test_window", _test_cls())
+        if created:
+            self._tw_has_clear_hipot = callable(getattr(tw, 'clear_hipot_log', None))
+            self._tw_has_clear_meas = callable(getattr(tw, 'clear_measurement_log', None))
+            # Fall back to the hipot log if the window has no measurement log
+            self._append_meas = getattr(tw, 'append_measurement_log', None) or tw.append_hypot_log
+        self._present(tw)
     
     def hide_test_window(self) -> None:
         """Hide the test window."""
-        if self.test_window:
-            self.test_window.hide()
-            self._process_events()
+        self._hide("test_window")
     
-    def close_test_window(self) -> None:
-        """Close and destroy the test window."""
-        if self.test_window:
-            self.test_window.close()
-            self.test_window = None
-            self._process_events()
+    def _destroy_test_window(self) -> None:
+        """Close and destroy the test window (only from cleanup; otherwise hide and reuse)."""
+        self._destroy("test_window")
     
     # ============================================================================
     # State Transitions - Orchestrate Screen Changes
@@ -167,8 +272,7 @@ class TestCoordinator:
         Transition back to scanning (after test complete or cancel).
         Hides test window, shows scan window.
         """
-        self.hide_test_window()
-        self.show_scan_window()
+        self._swap_test_for_scan()
     
     def complete_test_and_return_to_scan(self) -> None:
         """
@@ -176,10 +280,12 @@ class TestCoordinator:
         This is called after test passes and user clicks continue on success dialog.
         Hides test window and shows scan window.
         """
-        # Hide test window
-        self.hide_test_window()
-        # Show scan window
-        self.show_scan_window()
+        self._swap_test_for_scan()
+    
+    def _swap_test_for_scan(self) -> None:
+        """Hide the test window and bring up the scan window with a single event flush."""
+        self._hide("test_window")
+        self._present(self._ensure("scan_window", _scan_cls()))
     
     # ============================================================================
     # Hipot Test UI Updates
@@ -187,15 +293,17 @@ class TestCoordinator:
     
     def show_hipot_ready(self) -> None:
         """Show hipot in ready state (yellow light)."""
+        if self._post_to_gui(self.show_hipot_ready):
+            return
         if self.test_window:
             self.test_window.hypot_ready()
-            self._process_events()
     
     def show_hipot_running(self) -> None:
         """Show hipot in running state (blue light)."""
+        if self._post_to_gui(self.show_hipot_running):
+            return
         if self.test_window:
             self.test_window.hypot_running()
-            self._process_events()
     
     def show_hipot_result(self, passed: bool) -> None:
         """
@@ -204,34 +312,73 @@ class TestCoordinator:
         Args:
             passed: True for pass (green), False for fail (red)
         """
+        if self._post_to_gui(self.show_hipot_result, passed):
+            return
+        # Any steps still waiting on the pacing timer belong before the result
+        self.flush_hipot_log()
         if self.test_window:
             self.test_window.hypot_result(passed)
-            self._process_events()
     
     def append_hipot_log(self, message: str) -> None:
         """
         Append message to hipot log area.
         
+        Steps still waiting on the pacing timer are written first, so lines
+        always appear in the order they were sent.
+        
         Args:
             message: Log message to display
         """
+        if self._post_to_gui(self.append_hipot_log, message):
+            return
+        if self._hipot_queue:
+            self.flush_hipot_log()
+        self._write_hipot_log(message)
+    
+    def _write_hipot_log(self, text: str) -> None:
+        """Write text to the hipot log view (GUI thread only)."""
         if self.test_window:
-            self.test_window.append_hypot_log(message)
-            self._process_events()
+            self.test_window.append_hypot_log(text)
     
     def update_hipot_step(self, step_num: int, step_message: str, simulate: bool = False) -> None:
         """
         Update hipot test with current step.
         
+        Steps are queued and shown one per interval so the user can follow
+        them, without blocking the UI thread.
+        
         Args:
             step_num: Step number (1-5)
             step_message: Description of step
             simulate: If True, append "(SIM)" to message
         """
+        if self._post_to_gui(self.update_hipot_step, step_num, step_message, simulate):
+            return
         suffix = " (SIM)" if simulate else ""
-        message = f"Step {step_num}/5: {step_message}{suffix}"
-        self.append_hipot_log(message)
-        time.sleep(0.8)  # Visual pacing for user
+        self._hipot_queue.append(f"Step {step_num}/5: {step_message}{suffix}")
+        # Show the first step immediately and pace the rest. A synchronous caller
+        # may block the event loop past the interval (timer overdue), in which
+        # case the next step is due now rather than whenever the loop resumes.
+        if not self._hipot_timer.isActive() or self._hipot_timer.remainingTime() == 0:
+            self._drain_hipot_step()
+            self._hipot_timer.start()
+    
+    def _drain_hipot_step(self) -> None:
+        """Show the next queued hipot step; stop pacing once the queue is empty."""
+        if not self._hipot_queue:
+            self._hipot_timer.stop()
+            return
+        self._write_hipot_log(self._hipot_queue.popleft())
+    
+    def flush_hipot_log(self) -> None:
+        """Write all queued hipot steps at once (single log append) and stop pacing."""
+        if self._post_to_gui(self.flush_hipot_log):
+            return
+        self._hipot_timer.stop()
+        if self._hipot_queue:
+            lines = "\n".join(self._hipot_queue)
+            self._hipot_queue.clear()
+            self._write_hipot_log(lines)
     
     # ============================================================================
     # Measurement Test UI Updates
@@ -257,12 +404,37 @@ class TestCoordinator:
         """
         if self.test_window:
             if value is not None:
-                text = f"{config_name}: {value:.1f} Ω"
+                fmt = _VALUE_FMT.get(config_name)
+                text = fmt % value if fmt else f"{config_name}: {value:.1f} Ω"
             else:
-                text = f"{config_name}: TIMEOUT"
+                text = _TIMEOUT_TEXT.get(config_name) or f"{config_name}: TIMEOUT"
             
-            self.test_window.update_measurement(side, position, text, passed)
-            self._process_events()
+            if QtCore.QThread.currentThread() == self._invoker.thread():
+                # GUI-thread callers may block right after (sleep, instrument I/O),
+                # so the row is updated now rather than on a later flush
+                self._pending_meas.pop((side, position), None)
+                self.test_window.update_measurement(side, position, text, passed)
+                return
+            
+            # Worker thread: newer values for the same cell overwrite older ones,
+            # and a single posted flush applies whatever is pending
+            self._pending_meas[(side, position)] = (text, passed)
+            if not self._flush_posted:
+                self._flush_posted = True
+                self._invoker.call.emit(self._flush_updates)
+    
+    def _flush_updates(self) -> None:
+        """Push the measurement updates coalesced from worker threads to the test window."""
+        # Cleared first: a value queued while draining either lands in this
+        # loop or posts a fresh flush
+        self._flush_posted = False
+        pending = self._pending_meas
+        tw = self.test_window
+        while pending:
+            # popitem is atomic, so workers can keep adding while this drains
+            (side, position), (text, passed) = pending.popitem()
+            if tw:
+                tw.update_measurement(side, position, text, passed)
     
     def append_measurement_log(self, message: str) -> None:
         """
@@ -271,22 +443,17 @@ class TestCoordinator:
         Args:
             message: Log message to display
         """
+        if self._post_to_gui(self.append_measurement_log, message):
+            return
         if self.test_window:
-            try:
-                self.test_window.append_measurement_log(message)
-            except Exception:
-                # Fallback to hipot log if measurement log not available
-                self.test_window.append_hypot_log(message)
-            self._process_events()
+            self._append_meas(message)
     
     def clear_measurement_values(self) -> None:
         """Clear all measurement values (for retry)."""
+        if self._post_to_gui(self.clear_measurement_values):
+            return
         if self.test_window:
-            for position in range(3):
-                config_names = ["Pin 1 to 6", "Pin 2 to 5", "Pin 3 to 4"]
-                self.test_window.update_measurement("L", position, f"{config_names[position]}: ---", None)
-                self.test_window.update_measurement("R", position, f"{config_names[position]}: ---", None)
-            self._process_events()
+            self._blank_measurements()
     
     def reset_test_window(self) -> None:
         """
@@ -294,30 +461,38 @@ class TestCoordinator:
         Clears hipot status and all measurement values.
         Called when starting a new test.
         """
+        if self._post_to_gui(self.reset_test_window):
+            return
         if self.test_window:
+            # Drop hipot steps still queued from the previous run
+            self._hipot_timer.stop()
+            self._hipot_queue.clear()
+            
             # Reset hipot to ready state
             self.test_window.set_hypot_state("ready", "READY")
             
             # Clear all measurement values
-            for position in range(3):
-                config_names = ["Pin 1 to 6", "Pin 2 to 5", "Pin 3 to 4"]
-                self.test_window.update_measurement("L", position, f"{config_names[position]}: ---", None)
-                self.test_window.update_measurement("R", position, f"{config_names[position]}: ---", None)
+            self._blank_measurements()
             
-            # Clear logs if method exists
-            if hasattr(self.test_window, 'clear_hipot_log'):
-                try:
-                    self.test_window.clear_hipot_log()
-                except Exception:
-                    pass
-            
-            if hasattr(self.test_window, 'clear_measurement_log'):
-                try:
-                    self.test_window.clear_measurement_log()
-                except Exception:
-                    pass
-            
-            self._process_events()
+            # Clear logs if the window supports it
+            if self._tw_has_clear_hipot:
+                self.test_window.clear_hipot_log()
+            if self._tw_has_clear_meas:
+                self.test_window.clear_measurement_log()
+    
+    def _blank_measurements(self) -> None:
+        """Reset all six measurement rows to '---' in a single repaint."""
+        # Drop queued values so they don't overwrite the blanks after the reset
+        self._pending_meas.clear()
+        tw = self.test_window
+        tw.setUpdatesEnabled(False)
+        try:
+            for position, blank in enumerate(_BLANK_TEXT):
+                tw.update_measurement("L", position, blank, None)
+                tw.update_measurement("R", position, blank, None)
+        finally:
+            tw.setUpdatesEnabled(True)
+            tw.update()
     
     # ============================================================================
     # Dialog Prompts
@@ -331,8 +506,7 @@ class TestCoordinator:
             True if user clicked Continue, False if Exit
         """
         try:
-            from element_tester.system.widgets.continue_exit import ContinueExitDialog
-            return ContinueExitDialog.show_prompt(
+            return _continue_exit_cls().show_prompt(
                 parent=self.test_window,
                 title="Ready to Test",
                 message="Ready to begin testing?\n\nPress CONTINUE to start or EXIT to cancel."
@@ -353,8 +527,7 @@ class TestCoordinator:
             True if user wants to retry, False if exit
         """
         try:
-            from element_tester.system.widgets.continue_exit import ContinueExitDialog
-            return ContinueExitDialog.show_prompt(
+            return _continue_exit_cls().show_prompt(
                 parent=self.test_window,
                 title=f"{test_type} Failed",
                 message=f"Test failed: {failure_message}\n\nPress CONTINUE to retry or EXIT to cancel."
@@ -371,22 +544,43 @@ class TestCoordinator:
             part_number: Part number
         """
         try:
-            from element_tester.system.widgets.test_passed import TestPassedDialog
+            passed_dialog = _test_passed_cls()
             try:
-                TestPassedDialog.show_passed(parent=self.test_window, work_order=work_order, part_number=part_number)
+                passed_dialog.show_passed(parent=self.test_window, work_order=work_order, part_number=part_number)
             except TypeError:
                 # Fallback if older signature present
-                TestPassedDialog.show_passed(parent=self.test_window)
-        except Exception as e:
-            print(f"Could not show test passed dialog: {e}")
+                passed_dialog.show_passed(parent=self.test_window)
+        except Exception:
+            _log.exception("Could not show test passed dialog")
     
     # ============================================================================
     # Utility Methods
     # ============================================================================
     
-    def _process_events(self) -> None:
-        """Process Qt events to keep UI responsive."""
-        QtWidgets.QApplication.processEvents()
+    @staticmethod
+    def _flush_show(widget: QtWidgets.QWidget) -> None:
+        """
+        Deliver only the pending show and repaint events for a window so it is
+        visible before returning, without draining the whole event queue.
+        """
+        QtCore.QCoreApplication.sendPostedEvents(widget, QtCore.QEvent.Type.Show)
+        QtCore.QCoreApplication.sendPostedEvents(widget, QtCore.QEvent.Type.UpdateRequest)
+    
+    def _post_to_gui(self, fn: Callable[..., None], *args) -> bool:
+        """
+        Re-post `fn(*args)` to the GUI thread when called from a worker thread.
+        
+        Every public updater goes through this, so widgets and the
+        coordinator's timers are only ever touched on the GUI thread.
+        
+        Returns:
+            True if the call was posted, False if the caller is already on the
+            GUI thread and should carry on.
+        """
+        if QtCore.QThread.currentThread() == self._invoker.thread():
+            return False
+        self._invoker.call.emit(functools.partial(fn, *args))
+        return True
     
     def get_test_window(self):
         """Get reference to test window (for test_runner backward compatibility)."""
@@ -396,4 +590,5 @@ class TestCoordinator:
         """Hide all windows and clean up resources."""
         self.hide_test_window()
         self.hide_scan_window()
-        self._process_events()
+        self._destroy_test_window()
+        self._destroy_scan_window()
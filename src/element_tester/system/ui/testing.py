@@ -1,20 +1,137 @@
 from __future__ import annotations
+import functools
 from typing import Optional, Literal
 
 from PyQt6 import QtWidgets, QtCore, QtGui
 from PyQt6.QtWidgets import QMessageBox
 
-# Import DebugDialog so the Testing UI can open the standalone debug form.
-# Edit the callbacks in the `_open_debug_dialog()` helper below to change what
-# each debug button does (this is the single place to customize on-click behavior).
-try:
-    from element_tester.system.ui.debug import DebugDialog
-except Exception:
-    DebugDialog = None
+
+# DebugDialog lets the Testing UI open the standalone debug form. It is imported
+# on the first DEBUG click rather than at startup, and the result is cached.
+# Edit the callbacks in `_on_debug_clicked()` below to change what each debug
+# button does (this is the single place to customize on-click behavior).
+@functools.lru_cache(maxsize=None)
+def _debug_dialog_cls():
+    try:
+        from element_tester.system.ui.debug import DebugDialog
+    except Exception:
+        return None
+    return DebugDialog
 
 
 HypotState = Literal["ready", "running", "pass", "fail"]
 
+# Blank measurement row texts, by row index. No trailing value here; the
+# measuring code replaces "---" with the reading.
+_ROW_DEFAULTS = ("Pin 1 to 6: ---", "Pin 2 to 5: ---", "Pin 3 to 4: ---")
+
+# One window-level stylesheet, applied once in _build_ui. Widgets pick up their
+# rules through object-name selectors instead of per-widget setStyleSheet calls;
+# pass/fail colors switch via the measState / hypotState dynamic properties.
+_TEST_WINDOW_QSS = """
+    QLabel#sectionHeader {
+        background-color: #5C4B4B;
+        color: #FFFFFF;
+        padding: 10px;
+    }
+    QPlainTextEdit#hypotLog {
+        background-color: #E3E3E3;
+        border: 1px solid #AAAAAA;
+        color: #000000;
+    }
+    QPlainTextEdit#measurementLog {
+        background-color: #F5F5F5;
+        border: 1px solid #CCCCCC;
+        color: #000000;
+    }
+    QPushButton#toggleLogBtn {
+        background-color: #5C4B4B;
+        color: white;
+        font-weight: bold;
+        border-radius: 4px;
+    }
+    QPushButton#toggleLogBtn:hover {
+        background-color: #6C5B5B;
+    }
+    QPushButton#debugBtn {
+        background-color: #1976D2;
+        color: white;
+        font-weight: 700;
+    }
+    QFrame#measPanel {
+        background-color: #FFFFFF;
+        border-radius: 4px;
+    }
+    QLabel#measPanelHeader {
+        background-color: #5C4B4B;
+        color: #FFFFFF;
+        padding: 4px;
+        border-radius: 4px;
+    }
+    QLabel#measRow {
+        padding: 8px;
+        border-radius: 6px;
+    }
+    QLabel#measRow[measState="neutral"] {
+        background-color: #FFFFFF;
+        color: #000000;
+    }
+    QLabel#measRow[measState="pass"] {
+        background-color: #C8E6C9;
+        color: #1B5E20;
+    }
+    QLabel#measRow[measState="fail"] {
+        background-color: #FFCDD2;
+        color: #B71C1C;
+    }
+    QLabel#hypotStatus[hypotState="ready"],
+    QLabel#hypotStatus[hypotState="running"],
+    QLabel#hypotStatus[hypotState="pass"],
+    QLabel#hypotStatus[hypotState="fail"] {
+        border-radius: 4px;
+        padding: 6px;
+    }
+    QLabel#hypotStatus[hypotState="ready"] {
+        background-color: #E0E0E0;
+        color: #000000;
+    }
+    QLabel#hypotStatus[hypotState="running"] {
+        background-color: #FFF3CD;
+        color: #856404;
+    }
+    QLabel#hypotStatus[hypotState="pass"] {
+        background-color: #C8E6C9;
+        color: #1B5E20;
+    }
+    QLabel#hypotStatus[hypotState="fail"] {
+        background-color: #FFCDD2;
+        color: #B71C1C;
+    }
+"""
+
+# Lines kept in each log view; older lines are dropped so appends stay constant-cost
+_LOG_MAX_BLOCKS = 500
+
+
+def _font(point_size: int, bold: bool = False) -> QtGui.QFont:
+    f = QtGui.QFont()
+    f.setPointSize(point_size)
+    f.setBold(bold)
+    return f
+
+
+# Shared fonts; only size/weight are set so family still follows the app font
+_SECTION_HEADER_FONT = _font(24, bold=True)
+_PANEL_HEADER_FONT = _font(18, bold=True)
+_STATUS_FONT = _font(14)
+_ROW_FONT = _font(14)  # Increased from 12 for better readability
+
+# Shared size policies (setSizePolicy copies them, so sharing is safe)
+_SP_EXPANDING_PREFERRED = QtWidgets.QSizePolicy(
+    QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
+_SP_PREFERRED_MINIMUM = QtWidgets.QSizePolicy(
+    QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Minimum)
+
 
 class MainTestWindow(QtWidgets.QWidget):
     """
@@ -32,9 +149,20 @@ class MainTestWindow(QtWidgets.QWidget):
     def __init__(self, parent: Optional[QtWidgets.QWidget] = None):
         super().__init__(parent)
         self.setWindowTitle("Element Tester - Main")
+        # Debug dialog and operator prompts are built on first use and reused afterwards
+        self._debug_dlg = None
+        self._ready_mb: Optional[QMessageBox] = None
+        self._retry_mb: Optional[QMessageBox] = None
+        # Normal (restored) size; the window itself opens maximized below
         self.resize(1000, 650)
-        self._build_ui()
-        self.set_hypot_state("ready", "READY")
+        # Build and set the initial state with painting off, so the only
+        # layout/paint pass happens at the maximized size
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_ui()
+            self.set_hypot_state("ready", "READY")
+        finally:
+            self.setUpdatesEnabled(True)
         # Start in fullscreen mode
         self.showMaximized()
 
@@ -45,6 +173,7 @@ class MainTestWindow(QtWidgets.QWidget):
         pal = self.palette()
         pal.setColor(QtGui.QPalette.ColorRole.Window, QtGui.QColor("#D9D9D9"))
         self.setPalette(pal)
+        self.setStyleSheet(_TEST_WINDOW_QSS)
 
         root = QtWidgets.QVBoxLayout(self)
         root.setContentsMargins(30, 20, 30, 20)
@@ -56,29 +185,22 @@ class MainTestWindow(QtWidgets.QWidget):
 
         # Status line
         self.hypot_status = QtWidgets.QLabel("Status: READY")
-        f = self.hypot_status.font()
-        f.setPointSize(14)
-        self.hypot_status.setFont(f)
+        self.hypot_status.setFont(_STATUS_FONT)
         self.hypot_status.setAlignment(
             QtCore.Qt.AlignmentFlag.AlignCenter
         )
         self.hypot_status.setMinimumHeight(40)
+        self.hypot_status.setObjectName("hypotStatus")
         root.addWidget(self.hypot_status)
 
         # Log area
         self.hypot_log = QtWidgets.QPlainTextEdit()
         self.hypot_log.setReadOnly(True)
+        self.hypot_log.setMaximumBlockCount(_LOG_MAX_BLOCKS)
+        self.hypot_log.setUndoRedoEnabled(False)
         self.hypot_log.setMinimumHeight(95)  # Reduced from 160 (about 3/5 = 60%)
         self.hypot_log.setMaximumHeight(110)  # Limit max height to prevent expansion
-        self.hypot_log.setStyleSheet(
-            """
-            QPlainTextEdit {
-                background-color: #E3E3E3;
-                border: 1px solid #AAAAAA;
-                color: #000000;
-            }
-            """
-        )
+        self.hypot_log.setObjectName("hypotLog")
         root.addWidget(self.hypot_log)
 
         # Separator (simple line)
@@ -116,19 +238,7 @@ class MainTestWindow(QtWidgets.QWidget):
         toggle_row.addStretch(1)
         self.btn_toggle_log = QtWidgets.QPushButton("▲ Show Log")
         self.btn_toggle_log.setFixedSize(120, 30)
-        self.btn_toggle_log.setStyleSheet(
-            """
-            QPushButton {
-                background-color: #5C4B4B;
-                color: white;
-                font-weight: bold;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #6C5B5B;
-            }
-            """
-        )
+        self.btn_toggle_log.setObjectName("toggleLogBtn")
         self.btn_toggle_log.clicked.connect(self._toggle_measurement_log)
         toggle_row.addWidget(self.btn_toggle_log)
         log_layout.addLayout(toggle_row)
@@ -136,17 +246,12 @@ class MainTestWindow(QtWidgets.QWidget):
         # Measurement log
         self.measurement_log = QtWidgets.QPlainTextEdit()
         self.measurement_log.setReadOnly(True)
+        self.measurement_log.setMaximumBlockCount(_LOG_MAX_BLOCKS)
+        self.measurement_log.setUndoRedoEnabled(False)
         self.measurement_log.setMinimumHeight(120)
-        self.measurement_log.setStyleSheet(
-            """
-            QPlainTextEdit {
-                background-color: #F5F5F5;
-                border: 1px solid #CCCCCC;
-                color: #000000;
-            }
-            """
-        )
+        self.measurement_log.setObjectName("measurementLog")
         self.measurement_log.hide()  # Start hidden by default
+        self._has_meas_log = True
         log_layout.addWidget(self.measurement_log)
         
         root.addWidget(log_container)
@@ -159,7 +264,7 @@ class MainTestWindow(QtWidgets.QWidget):
 
         self.btn_debug = QtWidgets.QPushButton("DEBUG")
         self.btn_debug.setFixedSize(110, 44)
-        self.btn_debug.setStyleSheet("background-color: #1976D2; color: white; font-weight:700;")
+        self.btn_debug.setObjectName("debugBtn")
         self.btn_debug.clicked.connect(self._on_debug_clicked)
         bottom_row.addWidget(self.btn_debug)
 
@@ -167,21 +272,10 @@ class MainTestWindow(QtWidgets.QWidget):
 
     def _make_section_header(self, text: str) -> QtWidgets.QLabel:
         lab = QtWidgets.QLabel(text)
-        f = lab.font()
-        f.setPointSize(24)
-        f.setBold(True)
-        lab.setFont(f)
+        lab.setFont(_SECTION_HEADER_FONT)
         lab.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         lab.setMinimumHeight(60)
-        lab.setStyleSheet(
-            """
-            QLabel {
-                background-color: #5C4B4B;
-                color: #FFFFFF;
-                padding: 10px;
-            }
-            """
-        )
+        lab.setObjectName("sectionHeader")
         return lab
 
     def _make_meas_panel(self, side_label: str) -> QtWidgets.QWidget:
@@ -189,12 +283,11 @@ class MainTestWindow(QtWidgets.QWidget):
         Create one of the 'L' / 'R' boxes with 3 rows.
         """
         outer = QtWidgets.QFrame()
-        outer.setFrameShape(QtWidgets.QFrame.Shape.NoFrame)
-        outer.setStyleSheet("QFrame { background-color: #FFFFFF; border-radius: 4px; }")
+        outer.setObjectName("measPanel")
         outer.setMinimumWidth(420)  # Increased from 380 for fullscreen
         outer.setMinimumHeight(200)  # Ensure minimum height
         # Set size policy to prefer expanding but respect minimum size
-        outer.setSizePolicy(QtWidgets.QSizePolicy.Policy.Preferred, QtWidgets.QSizePolicy.Policy.Minimum)
+        outer.setSizePolicy(_SP_PREFERRED_MINIMUM)
 
         vbox = QtWidgets.QVBoxLayout(outer)
         vbox.setContentsMargins(0, 0, 0, 10)
@@ -202,21 +295,10 @@ class MainTestWindow(QtWidgets.QWidget):
 
         # Top header
         header = QtWidgets.QLabel(side_label)
-        f = header.font()
-        f.setPointSize(18)
-        f.setBold(True)
-        header.setFont(f)
+        header.setFont(_PANEL_HEADER_FONT)
         header.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
         header.setMinimumHeight(40)
-        header.setStyleSheet(
-            """
-            QLabel {
-                background-color: #5C4B4B;
-                color: #FFFFFF;
-                padding: 4px;
-            }
-            """
-        )
+        header.setObjectName("measPanelHeader")
         vbox.addWidget(header)
 
         # Body with 3 rows
@@ -225,34 +307,10 @@ class MainTestWindow(QtWidgets.QWidget):
         body_v.setContentsMargins(16, 10, 16, 10)
         body_v.setSpacing(12)
 
-        labels = []
-        # Use explicit row labels for correct pin pairings (no trailing colon here;
-        # the value insertion in the measuring code will add the ": <value>" part)
-        row_names = ["Pin 1 to 6: ---", "Pin 2 to 5: ---", "Pin 3 to 4: ---"]
-        for i in range(3):
-            lab = QtWidgets.QLabel(row_names[i])
-            f = lab.font()
-            f.setPointSize(14)  # Increased from 12 for better readability
-            lab.setFont(f)
-            lab.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
-            lab.setWordWrap(False)  # Prevent wrapping for cleaner display
-            # Make the label look like a touch-friendly rounded box and allow it
-            # to expand horizontally to fill the white panel area.
-            lab.setMinimumHeight(55)  # Increased for better visibility in fullscreen
-            lab.setMaximumHeight(70)  # Prevent excessive stretching
-            lab.setSizePolicy(QtWidgets.QSizePolicy.Policy.Expanding, QtWidgets.QSizePolicy.Policy.Preferred)
-            lab.setStyleSheet(
-                """
-                QLabel {
-                    background-color: #FFFFFF;
-                    color: #000000;
-                    padding: 8px;
-                    border-radius: 6px;
-                }
-                """
-            )
+        # Use explicit row labels for correct pin pairings
+        labels = [self._make_row_label(default_text) for default_text in _ROW_DEFAULTS]
+        for lab in labels:
             body_v.addWidget(lab)
-            labels.append(lab)
 
         body.setProperty("side", side_label)
         body.meas_labels = labels  # attach list for later updates
@@ -266,16 +324,36 @@ class MainTestWindow(QtWidgets.QWidget):
 
         return outer
 
+    @staticmethod
+    def _make_row_label(text: str) -> QtWidgets.QLabel:
+        """One measurement row; styling comes from the window's #measRow rules."""
+        lab = QtWidgets.QLabel(text)
+        lab.setFont(_ROW_FONT)
+        # QLabel doesn't word-wrap by default, which keeps the rows on one line
+        lab.setAlignment(QtCore.Qt.AlignmentFlag.AlignLeft | QtCore.Qt.AlignmentFlag.AlignVCenter)
+        # Make the label look like a touch-friendly rounded box and allow it
+        # to expand horizontally to fill the white panel area.
+        lab.setMinimumHeight(55)  # Increased for better visibility in fullscreen
+        lab.setMaximumHeight(70)  # Prevent excessive stretching
+        lab.setSizePolicy(_SP_EXPANDING_PREFERRED)
+        lab.setObjectName("measRow")
+        lab.setProperty("measState", "neutral")
+        return lab
+
     # ---------------- HYPOT BEHAVIOR ----------------
+    # Updaters are slots so they can also be invoked queued from other threads.
+    @QtCore.pyqtSlot(str)
     def append_hypot_log(self, line: str):
+        # Written at once: test_runner appends a step, calls processEvents()
+        # and then blocks, so a deferred line would stay hidden for the step
         self.hypot_log.appendPlainText(line)
 
+    @QtCore.pyqtSlot(str)
     def append_measurement_log(self, line: str):
         """Append a line to the measurement log area (touch/print friendly)."""
-        # Create the widget lazily if layout changes occur elsewhere
-        try:
+        if self._has_meas_log:
             self.measurement_log.appendPlainText(line)
-        except Exception:
+        else:
             # Fallback: also append to hypot log if measurement log missing
             self.append_hypot_log(line)
 
@@ -296,58 +374,32 @@ class MainTestWindow(QtWidgets.QWidget):
         state: "ready", "running", "pass", "fail"
         message: text after "Status:"
         """
-        self.hypot_status.setText(f"Status: {message}")
-
-        if state == "ready":
-            style = """
-                QLabel {
-                    background-color: #E0E0E0;
-                    color: #000000;
-                    border-radius: 4px;
-                    padding: 6px;
-                }
-            """
-        elif state == "running":
-            style = """
-                QLabel {
-                    background-color: #FFF3CD;
-                    color: #856404;
-                    border-radius: 4px;
-                    padding: 6px;
-                }
-            """
-        elif state == "pass":
-            style = """
-                QLabel {
-                    background-color: #C8E6C9;
-                    color: #1B5E20;
-                    border-radius: 4px;
-                    padding: 6px;
-                }
-            """
-        elif state == "fail":
-            style = """
-                QLabel {
-                    background-color: #FFCDD2;
-                    color: #B71C1C;
-                    border-radius: 4px;
-                    padding: 6px;
-                }
-            """
-        else:
-            style = ""
-
-        self.hypot_status.setStyleSheet(style)
+        text = f"Status: {message}"
+        if self.hypot_status.text() != text:
+            self.hypot_status.setText(text)
+        self._set_state(self.hypot_status, "hypotState", state)
+
+    @staticmethod
+    def _set_state(lab: QtWidgets.QLabel, prop: str, state: str):
+        """Switch a label's colors via the window stylesheet's [prop] rules."""
+        if lab.property(prop) == state:
+            return
+        lab.setProperty(prop, state)
+        # polish() alone re-resolves the stylesheet rules for the new property value
+        lab.style().polish(lab)
 
     # Convenience helpers for typical flow
+    @QtCore.pyqtSlot()
     def hypot_ready(self):
         self.set_hypot_state("ready", "READY")
         self.append_hypot_log("Hypot Ready...")
 
+    @QtCore.pyqtSlot()
     def hypot_running(self):
         self.set_hypot_state("running", "IN PROGRESS")
         self.append_hypot_log("Hypot in progress...")
 
+    @QtCore.pyqtSlot(bool)
     def hypot_result(self, passed: bool):
         if passed:
             self.set_hypot_state("pass", "PASS")
@@ -357,6 +409,7 @@ class MainTestWindow(QtWidgets.QWidget):
             self.append_hypot_log("Hypot FAIL.")
 
     # ---------------- MEASURING BEHAVIOR ----------------
+    @QtCore.pyqtSlot(str, int, str, object)
     def update_measurement(
         self,
         side: Literal["L", "R"],
@@ -381,36 +434,17 @@ class MainTestWindow(QtWidgets.QWidget):
             return
 
         lab = labels[row_index]
-        lab.setText(text)
+        # Unchanged text would still trigger a relayout of the label
+        if lab.text() != text:
+            lab.setText(text)
 
         if passed is True:
-            style = """
-                QLabel {
-                    background-color: #C8E6C9;
-                    color: #1B5E20;
-                    padding: 8px;
-                    border-radius: 6px;
-                }
-            """
+            state = "pass"
         elif passed is False:
-            style = """
-                QLabel {
-                    background-color: #FFCDD2;
-                    color: #B71C1C;
-                    padding: 8px;
-                    border-radius: 6px;
-                }
-            """
+            state = "fail"
         else:
-            style = """
-                QLabel {
-                    background-color: #FFFFFF;
-                    color: #000000;
-                    padding: 8px;
-                    border-radius: 6px;
-                }
-            """
-        lab.setStyleSheet(style)
+            state = "neutral"
+        self._set_state(lab, "measState", state)
 
     def reset_for_full_retry(self, clear_logs: bool = True):
         """
@@ -420,24 +454,26 @@ class MainTestWindow(QtWidgets.QWidget):
         - Clears/neutralizes all measurement rows (text + color)
         - Optionally clears hypot/measurement logs
         """
-        self.set_hypot_state("ready", "READY")
-
-        defaults = ["Pin 1 to 6: ---", "Pin 2 to 5: ---", "Pin 3 to 4: ---"]
-        for idx, text in enumerate(defaults):
-            self.update_measurement("L", idx, text, None)
-            self.update_measurement("R", idx, text, None)
+        # One repaint for the whole reset instead of one per widget
+        self.setUpdatesEnabled(False)
+        try:
+            self.set_hypot_state("ready", "READY")
+            self._reset_labels_fast()
 
-        if clear_logs:
-            try:
+            if clear_logs:
                 self.hypot_log.clear()
-            except Exception:
-                pass
-            try:
-                self.measurement_log.clear()
-            except Exception:
-                pass
-
-        QtWidgets.QApplication.processEvents()
+                if self._has_meas_log:
+                    self.measurement_log.clear()
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
+
+    def _reset_labels_fast(self):
+        """Put every measurement row back to its blank text and neutral style."""
+        for labels in (self._meas_labels_L, self._meas_labels_R):
+            for lab, default_text in zip(labels, _ROW_DEFAULTS):
+                lab.setText(default_text)
+                self._set_state(lab, "measState", "neutral")
 
     # ---------------- NEW: connection confirmation API ----------------
     def confirm_ready_to_test(self) -> bool:
@@ -450,13 +486,16 @@ class MainTestWindow(QtWidgets.QWidget):
                 proceed_with_test()
         Also emits the `readyToStart` signal when confirmed.
         """
-        resp = QMessageBox.question(
-            self,
-            "Confirm Connections",
-            "Are all connections made and is the unit ready to be tested?",
-            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
-            QMessageBox.StandardButton.No,
-        )
+        mb = self._ready_mb
+        if mb is None:
+            mb = self._ready_mb = QMessageBox(
+                QMessageBox.Icon.Question, "Confirm Connections",
+                "Are all connections made and is the unit ready to be tested?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No, self)
+        # Reset the default each time; the previous answer would otherwise stay focused
+        mb.setDefaultButton(QMessageBox.StandardButton.No)
+        mb.exec()
+        resp = mb.standardButton(mb.clickedButton())
         if resp == QMessageBox.StandardButton.Yes:
             self.append_hypot_log("Operator confirmed: unit ready")
             self.readyToStart.emit()
@@ -476,13 +515,17 @@ class MainTestWindow(QtWidgets.QWidget):
         Returns:
             True if operator wants to retry, False if they want to exit
         """
-        resp = QMessageBox.critical(
-            self,
-            f"{test_section} Test Failed",
-            f"{test_section} test failed:\n\n{error_msg}\n\nDo you want to retry the test?",
-            QMessageBox.StandardButton.Retry | QMessageBox.StandardButton.Cancel,
-            QMessageBox.StandardButton.Retry,
-        )
+        mb = self._retry_mb
+        if mb is None:
+            mb = self._retry_mb = QMessageBox(
+                QMessageBox.Icon.Critical, "", "",
+                QMessageBox.StandardButton.Retry | QMessageBox.StandardButton.Cancel, self)
+        # Reset the default each time; the previous answer would otherwise stay focused
+        mb.setDefaultButton(QMessageBox.StandardButton.Retry)
+        mb.setWindowTitle(f"{test_section} Test Failed")
+        mb.setText(f"{test_section} test failed:\n\n{error_msg}\n\nDo you want to retry the test?")
+        mb.exec()
+        resp = mb.standardButton(mb.clickedButton())
         
         if resp == QMessageBox.StandardButton.Retry:
             self.append_hypot_log(f"Operator chose to RETRY {test_section} test")
@@ -494,10 +537,15 @@ class MainTestWindow(QtWidgets.QWidget):
     # ---------------- NEW: debug dialog integration ----------------
     def _on_debug_clicked(self):
         """
-        Create and show the DebugDialog. Modify the `actions` dict below to
-        change what each debug button does — this is the single central place
-        to edit debug callbacks for the testing UI.
+        Show the DebugDialog, creating it on the first click. Modify the
+        `actions` dict below to change what each debug button does — this is
+        the single central place to edit debug callbacks for the testing UI.
         """
+        if self._debug_dlg is not None:
+            self._debug_dlg.exec()
+            return
+
+        DebugDialog = _debug_dialog_cls()
         if DebugDialog is None:
             QMessageBox.warning(self, "Debug Not Available", "DebugDialog import failed or is unavailable.")
             return
@@ -519,8 +567,8 @@ class MainTestWindow(QtWidgets.QWidget):
         }
         # ======== end editable section ========
 
-        dlg = DebugDialog(actions)
-        dlg.exec()
+        self._debug_dlg = DebugDialog(actions)
+        self._debug_dlg.exec()
 
 
 # Standalone test harness (optional)
@@ -6,6 +6,57 @@ from PyQt6 import QtWidgets, QtCore, QtGui
 from PyQt6.QtCore import Qt
 
 
+# One dialog-level stylesheet, applied once in __init__. Child widgets pick up
+# their rules through object-name selectors instead of per-widget setStyleSheet calls.
+# Colors match index.py (#bfbfbf background, #36a854 continue, #e13228 exit).
+_CONTINUE_EXIT_QSS = """
+    QDialog#ContinueExitDialog {
+        background-color: #bfbfbf;
+    }
+    QFrame#continueExitMsgFrame {
+        background-color: #ececec;
+        border: 2px solid #2b2b2b;
+        border-radius: 10px;
+    }
+    QLabel#continueExitMsgLabel {
+        font-size: 18px;
+        font-family: 'Segoe UI';
+        color: #2b2b2b;
+        background-color: transparent;
+        border: none;
+    }
+    QPushButton#continueExitContinueBtn, QPushButton#continueExitExitBtn {
+        color: #ffffff;
+        font-size: 24px;
+        font-weight: bold;
+        font-family: 'Segoe UI';
+        border: 2px solid #2b2b2b;
+        border-radius: 10px;
+    }
+    QPushButton#continueExitContinueBtn:hover, QPushButton#continueExitExitBtn:hover {
+        border: 2px solid #111111;
+    }
+    QPushButton#continueExitContinueBtn {
+        background-color: #36a854;
+    }
+    QPushButton#continueExitContinueBtn:hover {
+        background-color: #2d8a43;
+    }
+    QPushButton#continueExitContinueBtn:pressed {
+        background-color: #247036;
+    }
+    QPushButton#continueExitExitBtn {
+        background-color: #e13228;
+    }
+    QPushButton#continueExitExitBtn:hover {
+        background-color: #c72a21;
+    }
+    QPushButton#continueExitExitBtn:pressed {
+        background-color: #a8231b;
+    }
+"""
+
+
 class ContinueExitDialog(QtWidgets.QDialog):
     """
     Large continue/exit confirmation dialog.
@@ -22,12 +73,8 @@ class ContinueExitDialog(QtWidgets.QDialog):
         # Result for caller
         self.continue_selected = False
         
-        # Background color matching index.py (#bfbfbf)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #bfbfbf;
-            }
-        """)
+        self.setObjectName("ContinueExitDialog")
+        self.setStyleSheet(_CONTINUE_EXIT_QSS)
         
         # Main layout with margins
         layout = QtWidgets.QVBoxLayout(self)
@@ -37,32 +84,18 @@ class ContinueExitDialog(QtWidgets.QDialog):
         # Top message panel (light gray with border, rounded)
         msg_frame = QtWidgets.QFrame()
         msg_frame.setFixedHeight(145)
-        msg_frame.setStyleSheet("""
-            QFrame {
-                background-color: #ececec;
-                border: 2px solid #2b2b2b;
-                border-radius: 10px;
-            }
-        """)
+        msg_frame.setObjectName("continueExitMsgFrame")
         
         msg_layout = QtWidgets.QVBoxLayout(msg_frame)
         msg_layout.setContentsMargins(20, 20, 20, 20)
         
-        # Message text
-        if message:
-            msg_label = QtWidgets.QLabel(message)
-            msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            msg_label.setStyleSheet("""
-                QLabel {
-                    font-size: 18px;
-                    font-family: 'Segoe UI';
-                    color: #2b2b2b;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-            msg_label.setWordWrap(True)
-            msg_layout.addWidget(msg_label)
+        # Message text (kept so a reused dialog can show a new message)
+        self._msg_label = QtWidgets.QLabel(message)
+        self._msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._msg_label.setObjectName("continueExitMsgLabel")
+        self._msg_label.setWordWrap(True)
+        self._msg_label.setVisible(bool(message))
+        msg_layout.addWidget(self._msg_label)
         
         layout.addWidget(msg_frame)
         
@@ -74,48 +107,14 @@ class ContinueExitDialog(QtWidgets.QDialog):
         continue_btn = QtWidgets.QPushButton("CONTINUE")
         continue_btn.setFixedSize(330, 140)
         continue_btn.setCursor(QtGui.QCursor(Qt.CursorShape.PointingHandCursor))
-        continue_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #36a854;
-                color: #ffffff;
-                font-size: 24px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-                border: 2px solid #2b2b2b;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                border: 2px solid #111111;
-                background-color: #2d8a43;
-            }
-            QPushButton:pressed {
-                background-color: #247036;
-            }
-        """)
+        continue_btn.setObjectName("continueExitContinueBtn")
         continue_btn.clicked.connect(self._on_continue)
         
         # Exit button (red) - matching index.py #e13228
         exit_btn = QtWidgets.QPushButton("EXIT")
         exit_btn.setFixedSize(330, 140)
         exit_btn.setCursor(QtGui.QCursor(Qt.CursorShape.PointingHandCursor))
-        exit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e13228;
-                color: #ffffff;
-                font-size: 24px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-                border: 2px solid #2b2b2b;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                border: 2px solid #111111;
-                background-color: #c72a21;
-            }
-            QPushButton:pressed {
-                background-color: #a8231b;
-            }
-        """)
+        exit_btn.setObjectName("continueExitExitBtn")
         exit_btn.clicked.connect(self._on_exit)
         
         button_layout.addWidget(continue_btn)
@@ -123,6 +122,12 @@ class ContinueExitDialog(QtWidgets.QDialog):
         
         layout.addLayout(button_layout)
     
+    def set_message(self, title: str, message: str):
+        """Update title and message so the dialog can be shown again."""
+        self.setWindowTitle(title)
+        self._msg_label.setText(message)
+        self._msg_label.setVisible(bool(message))
+    
     def _on_continue(self):
         """Operator chose to continue."""
         self.continue_selected = True
@@ -142,6 +147,8 @@ class ContinueExitDialog(QtWidgets.QDialog):
         """
         Show the dialog and return True if operator chose Continue, False if Exit.
         
+        The dialog is built once per parent and reused for later prompts.
+        
         Args:
             parent: Parent widget
             title: Dialog window title
@@ -150,6 +157,13 @@ class ContinueExitDialog(QtWidgets.QDialog):
         Returns:
             True if Continue clicked, False if Exit clicked
         """
-        dialog = ContinueExitDialog(parent, title, message)
+        dialog = getattr(parent, "_continue_exit_dlg", None) if parent is not None else None
+        if dialog is None:
+            dialog = ContinueExitDialog(parent, title, message)
+            if parent is not None:
+                parent._continue_exit_dlg = dialog
+        else:
+            dialog.set_message(title, message)
+        dialog.continue_selected = False
         dialog.exec()
         return dialog.continue_selected
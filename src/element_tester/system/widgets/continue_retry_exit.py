@@ -3,9 +3,86 @@ Continue/Retry/Exit dialog widget for hipot test confirmation.
 Stylish large button dialog with rounded corners and modern design.
 Includes middle RETRY button for re-running the hipot test.
 """
-from PyQt6 import QtWidgets, QtCore, QtGui
+import enum
+import sys
+from typing import Optional
+
+from PyQt6 import QtWidgets, QtGui
 from PyQt6.QtCore import Qt
 
+_ALIGN_CENTER = Qt.AlignmentFlag.AlignCenter
+_POINTING_HAND = Qt.CursorShape.PointingHandCursor
+
+
+# One dialog-level stylesheet, applied once in __init__. Child widgets pick up
+# their rules through object-name selectors instead of per-widget setStyleSheet calls.
+# Colors match index.py (#c4c4c4 background, #35ad5d / #dea21c / #e23228 buttons).
+# Kept minified (one rule per source line) so Qt's CSS lexer has little to skip.
+_QDIALOG_RULES = "QDialog#ContinueRetryExitDialog{background-color:#c4c4c4}"
+_FRAME_RULES = (
+    "QFrame#msgFrame{background-color:#e6e6e6;border:2px solid #303030;border-radius:10px}"
+    "QLabel#msgLabel{font:18px 'Segoe UI';color:#303030}"
+)
+_BTN_BASE_RULES = (
+    "QPushButton#continueBtn,QPushButton#retryBtn,QPushButton#exitBtn{"
+    "color:#fff;font:bold 20px 'Segoe UI';border:2px solid #303030;border-radius:10px}"
+    "QPushButton#continueBtn:hover,QPushButton#retryBtn:hover,QPushButton#exitBtn:hover{border-color:#111}"
+)
+_BTN_CONTINUE_RULES = (
+    "QPushButton#continueBtn{background-color:#35ad5d}"
+    "QPushButton#continueBtn:hover{background-color:#2d8a4a}"
+    "QPushButton#continueBtn:pressed{background-color:#247038}"
+)
+_BTN_RETRY_RULES = (
+    "QPushButton#retryBtn{background-color:#dea21c}"
+    "QPushButton#retryBtn:hover{background-color:#c08f18}"
+    "QPushButton#retryBtn:pressed{background-color:#a27814}"
+)
+_BTN_EXIT_RULES = (
+    "QPushButton#exitBtn{background-color:#e23228}"
+    "QPushButton#exitBtn:hover{background-color:#c72921}"
+    "QPushButton#exitBtn:pressed{background-color:#a8221b}"
+)
+# Composed once at import and interned so every dialog hands Qt the same string object
+_DIALOG_QSS = sys.intern("".join((
+    _QDIALOG_RULES,
+    _FRAME_RULES,
+    _BTN_BASE_RULES,
+    _BTN_CONTINUE_RULES,
+    _BTN_RETRY_RULES,
+    _BTN_EXIT_RULES,
+)))
+
+
+class Result(enum.IntEnum):
+    """Operator choice returned by ContinueRetryExitDialog.show_prompt."""
+    CONTINUE = 0
+    RETRY = 1
+    EXIT = 2
+
+
+# exec() return codes. 0 is QDialog.Rejected, which is also what closing the
+# window (X / Esc) yields, so it maps to EXIT.
+_CODE_CONTINUE = 1
+_CODE_RETRY = 2
+_CODE_EXIT = 0
+_CODE_TO_RESULT = {
+    _CODE_CONTINUE: Result.CONTINUE,
+    _CODE_RETRY: Result.RETRY,
+    _CODE_EXIT: Result.EXIT,
+}
+
+
+_HAND_CURSOR: Optional[QtGui.QCursor] = None
+
+
+def _hand_cursor() -> QtGui.QCursor:
+    """Pointing-hand cursor shared by the dialog buttons, created on first use."""
+    global _HAND_CURSOR
+    if _HAND_CURSOR is None:
+        _HAND_CURSOR = QtGui.QCursor(_POINTING_HAND)
+    return _HAND_CURSOR
+
 
 class ContinueRetryExitDialog(QtWidgets.QDialog):
     """
@@ -14,26 +91,21 @@ class ContinueRetryExitDialog(QtWidgets.QDialog):
     Matches the visual style of the index.py design.
     """
     
-    # Return values for the dialog
-    CONTINUE = "CONTINUE"
-    RETRY = "RETRY HYPOT"
-    EXIT = "EXIT"
+    # Return values for the dialog (Result members, so comparisons are int compares)
+    CONTINUE = Result.CONTINUE
+    RETRY = Result.RETRY
+    EXIT = Result.EXIT
     
     def __init__(self, parent=None, title: str = "Hipot Test Result", message: str = ""):
         super().__init__(parent)
+        # Suppress intermediate repaints while the widget tree is assembled
+        self.setUpdatesEnabled(False)
         self.setWindowTitle(title)
         self.setModal(True)
         self.setFixedSize(800, 500)
         
-        # Result for caller
-        self.result = None
-        
-        # Background color matching index.py (#c4c4c4)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #c4c4c4;
-            }
-        """)
+        self.setObjectName("ContinueRetryExitDialog")
+        self.setStyleSheet(_DIALOG_QSS)
         
         # Main layout with margins
         layout = QtWidgets.QVBoxLayout(self)
@@ -43,32 +115,19 @@ class ContinueRetryExitDialog(QtWidgets.QDialog):
         # Top message panel (light gray with border, rounded)
         msg_frame = QtWidgets.QFrame()
         msg_frame.setFixedHeight(165)
-        msg_frame.setStyleSheet("""
-            QFrame {
-                background-color: #e6e6e6;
-                border: 2px solid #303030;
-                border-radius: 10px;
-            }
-        """)
+        msg_frame.setObjectName("msgFrame")
         
         msg_layout = QtWidgets.QVBoxLayout(msg_frame)
         msg_layout.setContentsMargins(20, 20, 20, 20)
         
         # Message text
-        if message:
-            msg_label = QtWidgets.QLabel(message)
-            msg_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            msg_label.setStyleSheet("""
-                QLabel {
-                    font-size: 18px;
-                    font-family: 'Segoe UI';
-                    color: #303030;
-                    background-color: transparent;
-                    border: none;
-                }
-            """)
-            msg_label.setWordWrap(True)
-            msg_layout.addWidget(msg_label)
+        # Always created (hidden when empty) so a reused dialog can change it
+        self._msg_label = QtWidgets.QLabel(message)
+        self._msg_label.setAlignment(_ALIGN_CENTER)
+        self._msg_label.setObjectName("msgLabel")
+        self._msg_label.setWordWrap(True)
+        self._msg_label.setVisible(bool(message))
+        msg_layout.addWidget(self._msg_label)
         
         layout.addWidget(msg_frame)
         
@@ -76,108 +135,67 @@ class ContinueRetryExitDialog(QtWidgets.QDialog):
         button_layout = QtWidgets.QHBoxLayout()
         button_layout.setSpacing(35)
         
-        # Continue button (green) - #35ad5d from reference
-        continue_btn = QtWidgets.QPushButton("CONTINUE")
-        continue_btn.setFixedSize(220, 140)
-        continue_btn.setCursor(QtGui.QCursor(Qt.CursorShape.PointingHandCursor))
-        continue_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #35ad5d;
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-                border: 2px solid #303030;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                border: 2px solid #111111;
-                background-color: #2d8a4a;
-            }
-            QPushButton:pressed {
-                background-color: #247038;
-            }
-        """)
-        continue_btn.clicked.connect(self._on_continue)
-        
-        # Retry button (orange/yellow) - #dea21c from reference
-        retry_btn = QtWidgets.QPushButton("RETRY HYPOT")
-        retry_btn.setFixedSize(220, 140)
-        retry_btn.setCursor(QtGui.QCursor(Qt.CursorShape.PointingHandCursor))
-        retry_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #dea21c;
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-                border: 2px solid #303030;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                border: 2px solid #111111;
-                background-color: #c08f18;
-            }
-            QPushButton:pressed {
-                background-color: #a27814;
-            }
-        """)
-        retry_btn.clicked.connect(self._on_retry)
-        
-        # Exit button (red) - #e23228 from reference
-        exit_btn = QtWidgets.QPushButton("EXIT")
-        exit_btn.setFixedSize(220, 140)
-        exit_btn.setCursor(QtGui.QCursor(Qt.CursorShape.PointingHandCursor))
-        exit_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #e23228;
-                color: #ffffff;
-                font-size: 20px;
-                font-weight: bold;
-                font-family: 'Segoe UI';
-                border: 2px solid #303030;
-                border-radius: 10px;
-            }
-            QPushButton:hover {
-                border: 2px solid #111111;
-                background-color: #c72921;
-            }
-            QPushButton:pressed {
-                background-color: #a8221b;
-            }
-        """)
-        exit_btn.clicked.connect(self._on_exit)
-        
-        button_layout.addWidget(continue_btn)
-        button_layout.addWidget(retry_btn)
-        button_layout.addWidget(exit_btn)
+        # CONTINUE (green), RETRY (orange/yellow), EXIT (red); colors live in _DIALOG_QSS
+        self._buttons = []
+        for text, name, slot in (
+            ("CONTINUE", "continueBtn", self._on_continue),
+            ("RETRY HYPOT", "retryBtn", self._on_retry),
+            ("EXIT", "exitBtn", self._on_exit),
+        ):
+            btn = QtWidgets.QPushButton(text)
+            btn.setObjectName(name)
+            btn.setFixedSize(220, 140)
+            btn.setCursor(_hand_cursor())
+            btn.clicked.connect(slot)
+            button_layout.addWidget(btn)
+            self._buttons.append(btn)
         
         layout.addLayout(button_layout)
+        
+        self.setUpdatesEnabled(True)
+        self.update()
+    
+    def set_message(self, title: str, message: str):
+        """Update title and message and re-arm the buttons so the dialog can be shown again."""
+        self.setWindowTitle(title)
+        self._msg_label.setText(message)
+        self._msg_label.setVisible(bool(message))
+        for btn in self._buttons:
+            btn.setEnabled(True)
+    
+    def _lock_sender(self):
+        """Disable the clicked button so a fast double-click can't fire it twice."""
+        btn = self.sender()
+        if btn is not None:
+            btn.setEnabled(False)
     
     def _on_continue(self):
         """Operator chose to continue."""
-        self.result = self.CONTINUE
-        self.accept()
+        self._lock_sender()
+        self.done(_CODE_CONTINUE)
     
     def _on_retry(self):
         """Operator chose to retry the hipot test."""
-        self.result = self.RETRY
-        self.accept()
+        self._lock_sender()
+        self.done(_CODE_RETRY)
     
     def _on_exit(self):
         """Operator chose to exit."""
-        self.result = self.EXIT
-        self.reject()
+        self._lock_sender()
+        self.done(_CODE_EXIT)
     
     @staticmethod
     def show_prompt(
         parent=None,
         title: str = "Hipot Test Result",
         message: str = ""
-    ) -> str:
+    ) -> Result:
         """
         Show the dialog and return the operator's choice.
         
+        The dialog is built once per parent and reused for later prompts
+        (e.g. each RETRY cycle in the hipot troubleshoot loop).
+        
         Args:
             parent: Parent widget
             title: Dialog window title
@@ -204,6 +222,11 @@ class ContinueRetryExitDialog(QtWidgets.QDialog):
                 # Exit the test sequence
                 pass
         """
-        dialog = ContinueRetryExitDialog(parent=parent, title=title, message=message)
-        dialog.exec()
-        return dialog.result if dialog.result else ContinueRetryExitDialog.EXIT
+        dialog = getattr(parent, "_continue_retry_exit_dlg", None) if parent is not None else None
+        if dialog is None:
+            dialog = ContinueRetryExitDialog(parent=parent, title=title, message=message)
+            if parent is not None:
+                parent._continue_retry_exit_dlg = dialog
+        else:
+            dialog.set_message(title, message)
+        return _CODE_TO_RESULT.get(dialog.exec(), Result.EXIT)
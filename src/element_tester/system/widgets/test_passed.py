@@ -4,59 +4,95 @@ Test Passed Dialog Widget
 Shows a success screen when both hipot and measurement tests pass.
 Displays "PASS" with green styling and a CONTINUE button.
 """
+from functools import partial
+from typing import Optional
+
 from PyQt6 import QtWidgets, QtCore, QtGui
 
+# QC print helper is optional; resolved once here instead of on every pass
+try:
+    from element_tester.system.procedures import print_qc as _print_qc
+except Exception:
+    _print_qc = None
+
+_ALIGN_CENTER = QtCore.Qt.AlignmentFlag.AlignCenter
+_ACCEPTED = QtWidgets.QDialog.DialogCode.Accepted
+
+
+_CHECK_PIXMAP: Optional[QtGui.QPixmap] = None
+
+
+def _check_pixmap() -> QtGui.QPixmap:
+    """96px green checkmark, rasterized once on first use so paints are a plain blit."""
+    global _CHECK_PIXMAP
+    if _CHECK_PIXMAP is None:
+        screen = QtGui.QGuiApplication.primaryScreen()
+        dpr = screen.devicePixelRatio() if screen is not None else 1.0
+        pix = QtGui.QPixmap(int(120 * dpr), int(120 * dpr))
+        pix.setDevicePixelRatio(dpr)
+        pix.fill(QtCore.Qt.GlobalColor.transparent)
+        font = QtGui.QFont()
+        font.setPixelSize(96)
+        font.setBold(True)
+        painter = QtGui.QPainter(pix)
+        painter.setRenderHint(QtGui.QPainter.RenderHint.TextAntialiasing)
+        painter.setFont(font)
+        painter.setPen(QtGui.QColor("#2ecc71"))
+        painter.drawText(QtCore.QRectF(0, 0, 120, 120), _ALIGN_CENTER, "✓")
+        painter.end()
+        _CHECK_PIXMAP = pix
+    return _CHECK_PIXMAP
+
+
+# One dialog-level stylesheet, minified; child widgets are matched by object name.
+_PASS_QSS = (
+    "QDialog#TestPassedDialog{background-color:#ecf0f1}"
+    "QLabel#passLabel{color:#2ecc71;font-size:72px;font-weight:bold}"
+    "QLabel#passMessageLabel{color:#27ae60;font-size:18px;font-weight:500}"
+    "QPushButton#passContinueBtn{background-color:#2ecc71;color:#fff;font-size:20px;"
+    "font-weight:bold;border:none;border-radius:5px;padding:15px}"
+    "QPushButton#passContinueBtn:hover{background-color:#27ae60}"
+    "QPushButton#passContinueBtn:pressed{background-color:#229954}"
+)
+
 
 class TestPassedDialog(QtWidgets.QDialog):
     """Dialog shown when test passes"""
     
     def __init__(self, parent=None):
         super().__init__(parent)
+        # Dialog background and all child styling, set before any child exists
+        # so each child is polished once on creation
+        self.setObjectName("TestPassedDialog")
+        self.setStyleSheet(_PASS_QSS)
         self.setWindowTitle("Test Passed")
         self.setModal(True)
         self.setMinimumSize(400, 300)
         
         # Main layout
-        layout = QtWidgets.QVBoxLayout()
+        layout = QtWidgets.QVBoxLayout(self)
+        # Hold off relayout until every child is added
+        layout.setEnabled(False)
         layout.setSpacing(30)
         layout.setContentsMargins(40, 40, 40, 40)
         
         # PASS label
         pass_label = QtWidgets.QLabel("PASS")
-        pass_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        pass_label.setStyleSheet("""
-            QLabel {
-                color: #2ecc71;
-                font-size: 72px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
+        pass_label.setAlignment(_ALIGN_CENTER)
+        pass_label.setObjectName("passLabel")
         layout.addWidget(pass_label)
         
         # Success icon/checkmark
-        check_label = QtWidgets.QLabel("✓")
-        check_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        check_label.setStyleSheet("""
-            QLabel {
-                color: #2ecc71;
-                font-size: 96px;
-                font-weight: bold;
-                background-color: transparent;
-            }
-        """)
+        check_label = QtWidgets.QLabel()
+        check_label.setPixmap(_check_pixmap())
+        check_label.setAlignment(_ALIGN_CENTER)
+        check_label.setObjectName("checkLabel")
         layout.addWidget(check_label)
         
         # Success message
         message_label = QtWidgets.QLabel("All tests completed successfully")
-        message_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        message_label.setStyleSheet("""
-            QLabel {
-                color: #27ae60;
-                font-size: 18px;
-                font-weight: 500;
-            }
-        """)
+        message_label.setAlignment(_ALIGN_CENTER)
+        message_label.setObjectName("passMessageLabel")
         layout.addWidget(message_label)
         
         # Spacer
@@ -65,34 +101,19 @@ class TestPassedDialog(QtWidgets.QDialog):
         # Continue button
         continue_btn = QtWidgets.QPushButton("CONTINUE")
         continue_btn.setMinimumHeight(60)
-        continue_btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2ecc71;
-                color: white;
-                font-size: 20px;
-                font-weight: bold;
-                border: none;
-                border-radius: 5px;
-                padding: 15px;
-            }
-            QPushButton:hover {
-                background-color: #27ae60;
-            }
-            QPushButton:pressed {
-                background-color: #229954;
-            }
-        """)
+        continue_btn.setObjectName("passContinueBtn")
         continue_btn.clicked.connect(self.accept)
         layout.addWidget(continue_btn)
-        
-        # Set dialog background
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #ecf0f1;
-            }
-        """)
-        
-        self.setLayout(layout)
+        layout.setEnabled(True)
+    
+    @staticmethod
+    def _do_qc_print(work_order: str, part_number: str) -> None:
+        """Run the QC print, swallowing printer errors so the dialog is unaffected."""
+        try:
+            # QTimer already enforces the 1s delay; call with no extra delay
+            _print_qc.print_message(work_order, part_number, delay_s=0.0)
+        except Exception:
+            pass
     
     @staticmethod
     def show_passed(parent=None, work_order: str | None = None, part_number: str | None = None) -> bool:
@@ -110,21 +131,9 @@ class TestPassedDialog(QtWidgets.QDialog):
         dialog = TestPassedDialog(parent)
 
         # Schedule QC print 1s after dialog is shown (if possible)
-        if work_order and part_number:
-            try:
-                import element_tester.system.procedures.print_qc as print_qc  # local import
-
-                def _do_print():
-                    try:
-                        # QTimer already enforces the 1s delay below; call with no extra delay
-                        print_qc.print_message(work_order, part_number, delay_s=0.0)
-                    except Exception:
-                        pass
-
-                QtCore.QTimer.singleShot(1000, _do_print)
-            except Exception:
-                # If helper not available, ignore silently
-                pass
+        # (if the print helper is not available, skip silently)
+        if _print_qc is not None and work_order and part_number:
+            QtCore.QTimer.singleShot(1000, partial(TestPassedDialog._do_qc_print, work_order, part_number))
 
         result = dialog.exec()
-        return result == QtWidgets.QDialog.DialogCode.Accepted
+        return result == _ACCEPTED